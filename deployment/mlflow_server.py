@@ -4,8 +4,10 @@ MLflow Server for Google Cloud Run
 This server provides experiment tracking for the anomaly detection project.
 """
 
+import importlib.util
 import logging
 import os
+import sys
 from pathlib import Path
 
 # Configure logging
@@ -15,30 +17,90 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
+def build_server_command(
+    backend_store_uri: str, default_artifact_root: str, port: int
+) -> list[str]:
+    """
+    Build the `mlflow server` command line.
+
+    `mlflow server` runs the tracking app under gunicorn. Gevent workers are
+    used when gevent is installed so many concurrent logging requests from
+    parallel training jobs are served without blocking; otherwise threaded
+    workers are used.
+    """
+    workers = int(os.getenv("MLFLOW_WORKERS", (os.cpu_count() or 1) * 2 + 1))
+
+    if importlib.util.find_spec("gevent") is not None:
+        gunicorn_opts = "-k gevent --worker-connections 1000"
+    else:
+        gunicorn_opts = "-k gthread --threads 8"
+    gunicorn_opts = os.getenv("MLFLOW_GUNICORN_OPTS", gunicorn_opts)
+
+    return [
+        sys.executable,
+        "-m",
+        "mlflow",
+        "server",
+        "--backend-store-uri",
+        backend_store_uri,
+        "--default-artifact-root",
+        default_artifact_root,
+        "--host",
+        "0.0.0.0",
+        "--port",
+        str(port),
+        "--workers",
+        str(workers),
+        "--gunicorn-opts",
+        f"{gunicorn_opts} --access-logfile -",
+    ]
+
+
 def main():
     """Start MLflow server."""
     try:
         import mlflow
-        from mlflow.server import app
 
         # Get configuration from environment
+        # DATABASE_URL points at PostgreSQL/Cloud SQL, e.g.
+        # postgresql+psycopg2://user:pass@/mlflow?host=/cloudsql/<instance>
         tracking_uri = os.getenv("MLFLOW_TRACKING_URI", "sqlite:///mlflow.db")
-        backend_store_uri = os.getenv("MLFLOW_BACKEND_STORE_URI", tracking_uri)
+        backend_store_uri = os.getenv(
+            "MLFLOW_BACKEND_STORE_URI", os.getenv("DATABASE_URL", tracking_uri)
+        )
         default_artifact_root = os.getenv("MLFLOW_DEFAULT_ARTIFACT_ROOT", "/mlflow")
 
+        if backend_store_uri.startswith("sqlite"):
+            logger.warning(
+                "Using SQLite backend store: writes are serialized by a file lock. "
+                "Set DATABASE_URL to a PostgreSQL database for production."
+            )
+        else:
+            # SQLAlchemy connection pool used by each gunicorn worker
+            os.environ.setdefault("MLFLOW_SQLALCHEMYSTORE_POOL_SIZE", "20")
+            os.environ.setdefault("MLFLOW_SQLALCHEMYSTORE_MAX_OVERFLOW", "40")
+
         # Set MLflow configuration
         mlflow.set_tracking_uri(tracking_uri)
 
-        # Create MLflow directories
-        Path("/mlflow").mkdir(exist_ok=True)
+        # Artifacts go straight to GCS/S3 when the root is remote; only a local
+        # root needs a directory (Cloud Run's local disk is in-memory)
+        if "://" not in default_artifact_root:
+            Path(default_artifact_root).mkdir(parents=True, exist_ok=True)
 
         logger.info("Starting MLflow server...")
         logger.info(f"Tracking URI: {tracking_uri}")
         logger.info(f"Backend Store URI: {backend_store_uri}")
         logger.info(f"Default Artifact Root: {default_artifact_root}")
 
-        # Start server
-        app.run(host="0.0.0.0", port=5000, debug=False)
+        # Start server (replaces this process so gunicorn receives signals directly)
+        cmd = build_server_command(
+            backend_store_uri,
+            default_artifact_root,
+            port=int(os.getenv("PORT", "5000")),
+        )
+        logger.info(f"Server command: {' '.join(cmd)}")
+        os.execv(cmd[0], cmd)
 
     except ImportError as e:
         logger.error(f"Failed to import MLflow: {e}")
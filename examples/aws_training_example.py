@@ -6,28 +6,60 @@ Este script demonstra como usar a integração AWS para treinar modelos
 de detecção de anomalias na cloud.
 """
 
+import functools
+import io
 import logging
 import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import redirect_stdout
+from itertools import islice
 from pathlib import Path
 
 # Adiciona o diretório src ao path
 sys.path.append(str(Path(__file__).parent.parent / "src"))
 
-from aws.aws_config_manager import AWSConfigManager
-from aws.aws_training import AWSTrainingManager
-
 # Configuração de logging
 logging.basicConfig(
     level=logging.INFO, format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
 )
 logger = logging.getLogger(__name__)
 
+# Recursos de otimização de custos exibidos na demonstração (rótulo, chave)
+COST_FEATURES = (
+    ("Spot Instances", "spot_instances"),
+    ("Reserved Instances", "reserved_instances"),
+    ("Savings Plans", "savings_plans"),
+)
+FEATURE_STATUS = {True: "✅ Habilitado", False: "❌ Desabilitado"}
+
+
+def buffered_stdout(func):
+    """Acumula os print() da função e os escreve de uma só vez ao final."""
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        buffer = io.StringIO()
+        try:
+            with redirect_stdout(buffer):
+                return func(*args, **kwargs)
+        finally:
+            sys.stdout.write(buffer.getvalue())
+            sys.stdout.flush()
+
+    return wrapper
 
+
+@buffered_stdout
 def main():
     """Função principal do exemplo."""
     print("🚀 Exemplo de Uso AWS para Petrobras Anomaly Detection")
     print("=" * 60)
 
+    # Importações adiadas: boto3/sagemaker só são carregados quando necessários
+    from aws.aws_config_manager import AWSConfigManager
+    from aws.aws_training import AWSTrainingManager
+
     try:
         # 1. Inicializar gerenciador de configuração
         print("\n1️⃣ Inicializando gerenciador de configuração AWS...")
@@ -87,9 +119,10 @@ def main():
             # 6. Listar jobs existentes
             print("\n6️⃣ Jobs de treinamento existentes:")
             try:
-                jobs = training_manager.list_training_jobs()
+                # Mostra apenas os 5 mais recentes
+                jobs = list(islice(training_manager.list_training_jobs(max_items=5), 5))
                 if jobs:
-                    for job in jobs[:5]:  # Mostra apenas os 5 mais recentes
+                    for job in jobs:
                         print(f"   • {job['job_name']} - {job['status']}")
                 else:
                     print("   📝 Nenhum job de treinamento encontrado")
@@ -134,14 +167,56 @@ def main():
         print("   • Se você tem permissões adequadas na AWS")
 
 
-def demo_hyperparameter_tuning():
+class _ThreadLocalStdout(io.TextIOBase):
+    """Direciona o print() de cada thread para um buffer próprio."""
+
+    def __init__(self, default):
+        self._default = default
+        self._local = threading.local()
+
+    def write(self, text):
+        return (getattr(self._local, "buffer", None) or self._default).write(text)
+
+    def flush(self):
+        self._default.flush()
+
+    def capture(self, func) -> str:
+        """Executa a função e retorna o que ela imprimiu nesta thread."""
+        self._local.buffer = io.StringIO()
+        try:
+            func()
+            return self._local.buffer.getvalue()
+        finally:
+            del self._local.buffer
+
+
+def run_demos_concurrently(*demos) -> None:
+    """
+    Executa demonstrações independentes em paralelo.
+
+    As demonstrações são dominadas por latência de chamadas AWS, então rodam
+    em threads (os clientes boto3 são compartilhados); a saída de cada uma é
+    acumulada separadamente e impressa em ordem, sem intercalar.
+    """
+    original_stdout = sys.stdout
+    stdout = _ThreadLocalStdout(original_stdout)
+    sys.stdout = stdout
+    try:
+        with ThreadPoolExecutor(max_workers=len(demos)) as executor:
+            outputs = list(executor.map(stdout.capture, demos))
+    finally:
+        sys.stdout = original_stdout
+
+    sys.stdout.write("".join(outputs))
+    sys.stdout.flush()
+
+
+def demo_hyperparameter_tuning(training_manager):
     """Demonstração de tuning de hiperparâmetros."""
     print("\n🔧 Demonstração de Tuning de Hiperparâmetros")
     print("=" * 50)
 
     try:
-        training_manager = AWSTrainingManager()
-
         # Configuração para TranAD
         tranad_config = training_manager.get_training_config("tranad")
 
@@ -176,14 +251,12 @@ def demo_hyperparameter_tuning():
         logger.error(f"Erro na demonstração de tuning: {e}")
 
 
-def demo_cost_optimization():
+def demo_cost_optimization(config_manager):
     """Demonstração de otimização de custos."""
     print("\n💰 Demonstração de Otimização de Custos")
     print("=" * 50)
 
     try:
-        config_manager = AWSConfigManager()
-
         # Criar alarme de custo
         print("🔔 Configurando alarme de custo...")
         if config_manager.create_cost_alarm(100, "MONTHLY"):
@@ -194,15 +267,9 @@ def demo_cost_optimization():
         # Configurações de otimização
         cost_config = config_manager.config.get("cost_optimization", {})
         print("\n⚙️ Configurações de otimização:")
-        print(
-            f"   • Spot Instances: {'✅ Habilitado' if cost_config.get('spot_instances', {}).get('enabled') else '❌ Desabilitado'}"
-        )
-        print(
-            f"   • Reserved Instances: {'✅ Habilitado' if cost_config.get('reserved_instances', {}).get('enabled') else '❌ Desabilitado'}"
-        )
-        print(
-            f"   • Savings Plans: {'✅ Habilitado' if cost_config.get('savings_plans', {}).get('enabled') else '❌ Desabilitado'}"
-        )
+        for label, key in COST_FEATURES:
+            enabled = bool(cost_config.get(key, {}).get("enabled"))
+            print(f"   • {label}: {FEATURE_STATUS[enabled]}")
 
         # Alertas de custo
         alerts_config = cost_config.get("cost_alerts", {})
@@ -214,14 +281,36 @@ def demo_cost_optimization():
         logger.error(f"Erro na demonstração de otimização de custos: {e}")
 
 
-if __name__ == "__main__":
-    # Executar exemplo principal
-    main()
+def create_demo_managers():
+    """
+    Cria os gerenciadores usados pelas demonstrações na thread principal.
+
+    Construir os gerenciadores cria clientes boto3 (e a sessão SageMaker) a
+    partir da sessão padrão, o que não é thread-safe; por isso eles são
+    criados aqui, antes de as demonstrações rodarem em paralelo.
+
+    Returns:
+        Tupla (training_manager, config_manager) ou None se houver erro
+    """
+    from aws.aws_config_manager import AWSConfigManager
+    from aws.aws_training import AWSTrainingManager
+
+    try:
+        training_manager = AWSTrainingManager()
+        config_manager = AWSConfigManager()
+        # Cliente usado pela demonstração de custos (criado sob demanda)
+        if config_manager.cloudwatch_client is None:
+            logger.warning("Cliente CloudWatch indisponível")
+    except Exception as e:
+        logger.error(f"Erro ao criar gerenciadores das demonstrações: {e}")
+        return None
+
+    return training_manager, config_manager
 
-    # Executar demonstrações adicionais
-    demo_hyperparameter_tuning()
-    demo_cost_optimization()
 
+@buffered_stdout
+def print_references():
+    """Imprime as referências de documentação."""
     print("\n" + "=" * 60)
     print("🎯 Para mais informações, consulte:")
     print("   📚 docs/AWS_SETUP.md")
@@ -229,3 +318,19 @@ if __name__ == "__main__":
     print("   🔧 src/aws/aws_config_manager.py")
     print("   🚀 src/aws/aws_training.py")
     print("=" * 60)
+
+
+if __name__ == "__main__":
+    # Executar exemplo principal
+    main()
+
+    # Executar demonstrações adicionais (independentes entre si)
+    managers = create_demo_managers()
+    if managers is not None:
+        training_manager, config_manager = managers
+        run_demos_concurrently(
+            functools.partial(demo_hyperparameter_tuning, training_manager),
+            functools.partial(demo_cost_optimization, config_manager),
+        )
+
+    print_references()
@@ -12,18 +12,25 @@ This script demonstrates how to use the GCP integration modules to:
 
 import argparse
 import logging
+import os
 import sys
+import tempfile
 from pathlib import Path
 
 # Add src to path
 sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
-from gcp.auth import GCPAuthenticator
-from gcp.config import GCPConfig
-from gcp.mlflow_integration import MLflowGCSIntegration
-from gcp.storage import GCSManager
-from gcp.training import AIPlatformTrainer
-from gcp.vertex_ai import VertexAIManager
+# Python requirements of the training container, shared by both training
+# backends so every submission resolves the exact same environment
+TRAINING_REQUIREMENTS = (
+    "torch>=2.0.1",
+    "polars>=1.32.3",
+    "scikit-learn>=1.7.1",
+    "numpy>=1.24.0",
+)
+
+# The gcp modules (google-cloud-*, mlflow) are imported only after argument
+# parsing, so `--help` and the unused training branch don't pay SDK import cost.
 
 
 def setup_logging():
@@ -68,6 +75,11 @@ def main():
     logger.info("Starting LSTM-VAE model training on Google Cloud Platform")
     logger.info(f"Arguments: {vars(args)}")
 
+    from gcp.auth import GCPAuthenticator
+    from gcp.config import GCPConfig
+    from gcp.mlflow_integration import MLflowGCSIntegration
+    from gcp.storage import GCSManager
+
     try:
         # Initialize GCP configuration
         logger.info("Initializing GCP configuration...")
@@ -105,7 +117,8 @@ def main():
         # Start MLflow run
         run_name = f"lstm_vae_training_{args.model_name}_{args.epochs}epochs"
         with mlflow_integration.start_run(run_name=run_name):
-            # Log parameters
+            # Log parameters; the batch is flushed before the job is
+            # submitted, so nothing is held in memory during the wait
             params = {
                 "model_type": "lstm_vae",
                 "epochs": args.epochs,
@@ -114,23 +127,21 @@ def main():
                 "data_path": data_gcs_uri,
                 "model_name": args.model_name,
             }
-            mlflow_integration.log_params(params)
+            with mlflow_integration.batch_logging():
+                mlflow_integration.log_params(params)
 
             if args.use_vertex_ai:
                 # Use Vertex AI for training
                 logger.info("Using Vertex AI for training...")
+                from gcp.vertex_ai import VertexAIManager
+
                 vertex_ai = VertexAIManager(config, authenticator)
 
                 # Create training job
                 training_job = vertex_ai.create_custom_training_job(
                     display_name=f"lstm-vae-training-{args.model_name}",
                     script_path="gs://your-bucket/training_scripts/train_lstm_vae.py",
-                    requirements=[
-                        "torch>=2.0.1",
-                        "polars>=1.32.3",
-                        "scikit-learn>=1.7.1",
-                        "numpy>=1.24.0",
-                    ],
+                    requirements=list(TRAINING_REQUIREMENTS),
                     machine_type="n1-standard-4",
                     accelerator_type="NVIDIA_TESLA_T4",
                     accelerator_count=1,
@@ -140,7 +151,7 @@ def main():
                 running_job = vertex_ai.start_training_job(training_job)
 
                 # Log job information
-                mlflow_integration.log_artifact(
+                mlflow_integration.log_text(
                     f"Job ID: {running_job.name}", "training_job_info.txt"
                 )
 
@@ -149,6 +160,8 @@ def main():
             else:
                 # Use AI Platform for training
                 logger.info("Using AI Platform for training...")
+                from gcp.training import AIPlatformTrainer
+
                 ai_trainer = AIPlatformTrainer(config, authenticator)
 
                 # Create training script
@@ -169,19 +182,15 @@ def main():
                 job_id = ai_trainer.submit_training_job(
                     job_name=f"lstm-vae-training-{args.model_name}",
                     script_path=script_gcs_uri,
-                    requirements=[
-                        "torch>=2.0.1",
-                        "polars>=1.32.3",
-                        "scikit-learn>=1.7.1",
-                        "numpy>=1.24.0",
-                    ],
+                    requirements=list(TRAINING_REQUIREMENTS),
                     machine_type="n1-standard-4",
                     accelerator_type="NVIDIA_TESLA_T4",
                     accelerator_count=1,
                 )
 
-                # Log job information
-                mlflow_integration.log_artifact(
+                # Log job information before waiting, so the job ID is kept
+                # even if the wait below fails or is interrupted
+                mlflow_integration.log_text(
                     f"Job ID: {job_id}", "training_job_info.txt"
                 )
 
@@ -196,9 +205,13 @@ def main():
 
                     # Log final metrics
                     if final_state == "SUCCEEDED":
-                        # Get job logs
-                        logs = ai_trainer.get_job_logs(job_id)
-                        mlflow_integration.log_artifact(logs, "training_logs.txt")
+                        # Get job logs; streamed to a temp file kept alive
+                        # until the upload
+                        with tempfile.TemporaryDirectory() as logs_dir:
+                            logs_path = ai_trainer.save_job_logs(
+                                job_id, os.path.join(logs_dir, "training_logs.txt")
+                            )
+                            mlflow_integration.log_artifact(logs_path)
 
                         # Log success metrics
                         mlflow_integration.log_metrics(
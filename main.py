@@ -50,6 +50,8 @@ def train(model_name: str, platform: str, config_path: str):
             # This is a placeholder for the actual training logic.
             # You would typically initialize the manager and trigger a training job.
             click.echo("Initializing AWS Training Manager...")
+            # Import inside the branch so `--help` and GCP runs don't load boto3/sagemaker:
+            # from anomaly_detection.aws.aws_training import AWSTrainingManager
             # aws_manager = AWSTrainingManager(config_path=config_path)
             # config = aws_manager.get_training_config(model_name)
             # aws_manager.create_training_job(config)
@@ -58,6 +60,8 @@ def train(model_name: str, platform: str, config_path: str):
         elif platform == "gcp":
             # Placeholder for GCP training logic
             click.echo("Initializing GCP AI Platform Trainer...")
+            # Import inside the branch so `--help` and AWS runs don't load google-cloud-*:
+            # from anomaly_detection.gcp.training import AIPlatformTrainer
             # gcp_trainer = AIPlatformTrainer(...) # Initialization would require config and auth
             # gcp_trainer.create_training_job(...)
             click.echo("Placeholder: GCP training job would be created here.")
@@ -7,7 +7,9 @@ para carregar e processar dados de detecção de anomalias em poços offshore.
 
 import marimo as mo
 import logging
+import os
 import sys
+from dataclasses import dataclass
 from pathlib import Path
 
 # Importa os módulos do projeto
@@ -22,6 +24,60 @@ logging.basicConfig(level=logging.INFO)
 project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
 
+
+@dataclass(slots=True, frozen=True)
+class DataSummary:
+    """Resumo imutável (e hasheável) dos dados carregados de um problema."""
+
+    problem: str
+    x_train_shape: tuple[int, ...]
+    y_train_shape: tuple[int, ...]
+    x_test_shape: tuple[int, ...]
+    y_test_shape: tuple[int, ...]
+    normalized: bool
+
+    @classmethod
+    def from_data(cls, data: dict) -> "DataSummary":
+        """Cria o resumo a partir do dicionário retornado pelo data loader."""
+        return cls(
+            problem=data["problem_name"],
+            x_train_shape=data["X_train"].shape,
+            y_train_shape=data["y_train"].shape,
+            x_test_shape=data["X_test"].shape,
+            y_test_shape=data["y_test"].shape,
+            normalized=data["normalized"],
+        )
+
+    def to_display(self) -> dict:
+        """Formato exibido nas células."""
+        return {
+            "Problema": self.problem,
+            "Forma X_train": str(self.x_train_shape),
+            "Forma y_train": str(self.y_train_shape),
+            "Forma X_test": str(self.x_test_shape),
+            "Forma y_test": str(self.y_test_shape),
+            "Normalizado": self.normalized,
+        }
+
+
+@mo.cache
+def load_problem_split(problem_name: str, fold_config: str) -> dict | None:
+    """
+    Carrega o primeiro fold de um problema, com cache entre execuções da célula.
+
+    A chave do cache são os argumentos, então reexecutar a célula sem mudar o
+    problema/fold não relê nem renormaliza os dados.
+    """
+    data_loader = create_data_loader(use_threew=True, cache_data=True)
+    return data_loader.load_threew_problem(
+        problem_name=problem_name,
+        fold_config=fold_config,
+        fold_index=0,
+        normalize=True,
+        test_size=0.2,
+    )
+
+
 # =============================================================================
 # CÉLULAS MARIMO
 # =============================================================================
@@ -126,34 +182,31 @@ def load_data(problems):
         # Verifica configurações de folds
         folds_dir = Path(project_root) / "3W" / "dataset" / "folds"
         if folds_dir.exists():
-            fold_files = [f.stem for f in folds_dir.glob("*.csv")]
+            # Uma única passada com scandir (sem fnmatch nem objetos Path);
+            # ordenado para que o primeiro fold seja determinístico
+            with os.scandir(folds_dir) as entries:
+                fold_files = sorted(
+                    entry.name[: -len(".csv")]
+                    for entry in entries
+                    if entry.name.endswith(".csv") and entry.is_file()
+                )
             mo.md(f"Configurações de folds disponíveis: {fold_files}")
 
             if fold_files:
                 first_fold = fold_files[0]
                 mo.md(f"Usando configuração de fold: **{first_fold}**")
 
-                data = data_loader.load_threew_problem(
-                    problem_name=first_problem,
-                    fold_config=first_fold,
-                    fold_index=0,
-                    normalize=True,
-                    test_size=0.2,
-                )
+                data = load_problem_split(first_problem, first_fold)
 
                 if data:
                     mo.md("✅ Dados carregados com sucesso!")
 
+                    # Cópia rasa: o dicionário em cache não é alterado abaixo
+                    data = dict(data)
+
                     # Resumo dos dados
-                    data_summary = {
-                        "Problema": data["problem_name"],
-                        "Forma X_train": str(data["X_train"].shape),
-                        "Forma y_train": str(data["y_train"].shape),
-                        "Forma X_test": str(data["X_test"].shape),
-                        "Forma y_test": str(data["y_test"].shape),
-                        "Normalizado": data["normalized"],
-                    }
-                    mo.json(data_summary)
+                    data["summary"] = DataSummary.from_data(data)
+                    mo.json(data["summary"].to_display())
 
                     return data
                 else:
@@ -197,8 +250,8 @@ def preprocessing(data):
         # Compara formas
         comparison = {
             "Original": {
-                "X_train": str(data["X_train"].shape),
-                "X_test": str(data["X_test"].shape),
+                "X_train": str(data["summary"].x_train_shape),
+                "X_test": str(data["summary"].x_test_shape),
             },
             "Processado": {
                 "X_train": str(X_train_processed.shape),
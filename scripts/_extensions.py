@@ -0,0 +1,147 @@
+"""
+Lista única das extensões do VS Code/Cursor usadas pelos instaladores do projeto.
+
+Cada grupo é uma tupla de pares (id, descrição); ALL_EXTENSIONS reúne todos
+os grupos sem repetições.
+"""
+
+# 🐍 Python Development
+PYTHON_EXTENSIONS = (
+    ("ms-python.python", "Suporte completo ao Python"),
+    ("ms-python.vscode-pylance", "IntelliSense avançado para Python"),
+    ("ms-python.debugpy", "Debugger Python"),
+    ("ms-python.isort", "Organização de imports"),
+    ("charliermarsh.ruff", "Linting e formatação rápida"),
+)
+
+# 🤖 Claude Code - Extensões Específicas para IA e ML
+CLAUDE_EXTENSIONS = (
+    ("ms-python.black-formatter", "Formatação automática Black"),
+    ("ms-python.flake8", "Linting Flake8"),
+    ("ms-python.mypy-type-checker", "Verificação de tipos MyPy"),
+    ("ms-python.pylint", "Análise de código Pylint"),
+    ("ms-python.autopep8", "Formatação automática PEP 8"),
+)
+
+# 📊 Data Science & Jupyter
+DS_EXTENSIONS = (
+    ("ms-toolsai.jupyter", "Suporte completo ao Jupyter"),
+    ("ms-toolsai.jupyter-keymap", "Atalhos para Jupyter"),
+    ("ms-toolsai.jupyter-renderers", "Renderizadores para diferentes formatos"),
+)
+
+# 🔧 Development Tools
+DEV_EXTENSIONS = (
+    ("ms-vscode.vscode-json", "Suporte ao JSON"),
+    ("yzhang.markdown-all-in-one", "Editor Markdown avançado"),
+    ("esbenp.prettier-vscode", "Formatador de código"),
+    ("ms-vscode.vscode-typescript-next", "TypeScript nightly"),
+    ("bradlc.vscode-tailwindcss", "IntelliSense Tailwind CSS"),
+)
+
+# 🐳 Docker & Containers
+DOCKER_EXTENSIONS = (
+    ("ms-azuretools.vscode-docker", "Suporte ao Docker"),
+    ("ms-kubernetes-tools.vscode-kubernetes-tools", "Suporte ao Kubernetes"),
+)
+
+# 🔄 Git & Version Control
+GIT_EXTENSIONS = (
+    ("eamodio.gitlens", "Git supercharged"),
+    ("donjayamanne.githistory", "Histórico Git"),
+    ("github.vscode-github-actions", "GitHub Actions"),
+    ("github.vscode-pull-request-github", "Pull Requests GitHub"),
+    ("vivaxy.vscode-conventional-commits", "Commits convencionais"),
+)
+
+# 🎨 Themes & Icons
+THEME_EXTENSIONS = (
+    ("pkief.material-icon-theme", "Ícones Material Design"),
+    ("github.github-vscode-theme", "Tema GitHub"),
+    ("johnpapa.vscode-peacock", "Cores personalizadas"),
+)
+
+# 🧪 Testing
+TEST_EXTENSIONS = (
+    ("littlefoxteam.vscode-python-test-adapter", "Test runner Python"),
+    ("firsttris.vscode-jest-runner", "Test runner Jest"),
+    ("orta.vscode-jest", "Integração Jest"),
+    ("vitest.explorer", "Test explorer Vitest"),
+)
+
+# 🚀 AI & Productivity
+AI_EXTENSIONS = (
+    ("GitHub.copilot", "Assistente de IA para código"),
+    ("GitHub.copilot-chat", "Chat com IA para desenvolvimento"),
+    ("visualstudioexptteam.vscodeintellicode", "IntelliCode"),
+    ("visualstudioexptteam.intellicode-api-usage-examples", "Exemplos de API"),
+)
+
+# 🔍 Code Quality & Analysis
+QUALITY_EXTENSIONS = (
+    ("sonarsource.sonarlint-vscode", "Análise de código SonarLint"),
+    ("streetsidesoftware.code-spell-checker", "Verificador de ortografia"),
+    (
+        "streetsidesoftware.code-spell-checker-portuguese-brazilian",
+        "Português brasileiro",
+    ),
+    ("sourcery.sourcery", "Refatoração automática"),
+)
+
+# 🎯 Language Support
+LANG_EXTENSIONS = (
+    ("redhat.vscode-yaml", "Suporte ao YAML"),
+    ("tamasfe.even-better-toml", "Suporte ao TOML"),
+    ("ms-vscode.makefile-tools", "Suporte ao Makefile"),
+    ("naumovs.color-highlight", "Destaque de cores"),
+    ("oderwat.indent-rainbow", "Indentação colorida"),
+)
+
+# 🛠️ Utilities
+UTIL_EXTENSIONS = (
+    ("chakrounanas.turbo-console-log", "Console log rápido"),
+    ("christian-kohler.path-intellisense", "Autocompletar de caminhos"),
+    ("gruntfuggly.todo-tree", "Árvore de TODOs"),
+    ("wallabyjs.quokka-vscode", "Quokka.js"),
+    ("xyz.local-history", "Histórico local"),
+)
+
+# 🌐 Web Development
+WEB_EXTENSIONS = (
+    ("ms-vscode.live-server", "Live Server"),
+    ("vue.volar", "Suporte ao Vue"),
+    ("zignd.html-css-class-completion", "Autocompletar CSS"),
+)
+
+# 📊 Database & APIs
+DB_EXTENSIONS = (
+    ("cweijan.dbclient-jdbc", "Cliente JDBC"),
+    ("cweijan.vscode-redis-client", "Cliente Redis"),
+    ("humao.rest-client", "Cliente REST"),
+)
+
+# 🔧 Advanced Tools
+ADVANCED_EXTENSIONS = (
+    ("adpyke.codesnap", "Captura de código"),
+    ("jebbs.plantuml", "PlantUML"),
+    ("quicktype.quicktype", "QuickType"),
+    ("tim-koehler.helm-intellisense", "Helm IntelliSense"),
+)
+
+ALL_EXTENSIONS: frozenset[tuple[str, str]] = frozenset(
+    PYTHON_EXTENSIONS
+    + CLAUDE_EXTENSIONS
+    + DS_EXTENSIONS
+    + DEV_EXTENSIONS
+    + DOCKER_EXTENSIONS
+    + GIT_EXTENSIONS
+    + THEME_EXTENSIONS
+    + TEST_EXTENSIONS
+    + AI_EXTENSIONS
+    + QUALITY_EXTENSIONS
+    + LANG_EXTENSIONS
+    + UTIL_EXTENSIONS
+    + WEB_EXTENSIONS
+    + DB_EXTENSIONS
+    + ADVANCED_EXTENSIONS
+)
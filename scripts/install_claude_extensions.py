@@ -4,8 +4,34 @@
 🚀 Script Python cross-platform para instalar extensões específicas para Claude Code
 """
 
+import os
 import subprocess
 import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from _extensions import (
+    ADVANCED_EXTENSIONS,
+    AI_EXTENSIONS,
+    CLAUDE_EXTENSIONS,
+    DB_EXTENSIONS,
+    DEV_EXTENSIONS,
+    DOCKER_EXTENSIONS,
+    DS_EXTENSIONS,
+    GIT_EXTENSIONS,
+    LANG_EXTENSIONS,
+    PYTHON_EXTENSIONS,
+    QUALITY_EXTENSIONS,
+    TEST_EXTENSIONS,
+    THEME_EXTENSIONS,
+    UTIL_EXTENSIONS,
+    WEB_EXTENSIONS,
+)
+
+# Instalações são limitadas por I/O (cada uma inicia o CLI do VS Code)
+MAX_INSTALL_WORKERS = min(8, os.cpu_count() or 4)
+
+_print_lock = threading.Lock()
 
 
 # Cores para output no terminal
@@ -58,11 +84,21 @@ def install_extension(extension_id, description=""):
             check=True,
             capture_output=True,
         )
-        print(f"  ✅ {extension_id} - {description}")
-        return True
+        line = f"  ✅ {extension_id} - {description}\n"
+        success = True
     except subprocess.CalledProcessError as e:
-        print(f"  ❌ {extension_id} - Erro: {e}")
-        return False
+        line = f"  ❌ {extension_id} - Erro: {e}\n"
+        success = False
+
+    with _print_lock:
+        sys.stdout.write(line)
+    return success
+
+
+def install_extension_group(extensions):
+    """Instala um grupo de extensões (id, descrição) em paralelo"""
+    with ThreadPoolExecutor(max_workers=MAX_INSTALL_WORKERS) as pool:
+        return list(pool.map(lambda ext: install_extension(*ext), extensions))
 
 
 def install_extensions():
@@ -73,194 +109,75 @@ def install_extensions():
 
     # 🐍 Python Development
     print(f"\n{Colors.OKGREEN}🐍 Instalando extensões Python...{Colors.ENDC}")
-    python_extensions = [
-        ("ms-python.python", "Suporte completo ao Python"),
-        ("ms-python.vscode-pylance", "IntelliSense avançado para Python"),
-        ("ms-python.debugpy", "Debugger Python"),
-        ("ms-python.isort", "Organização de imports"),
-        ("charliermarsh.ruff", "Linting e formatação rápida"),
-    ]
-
-    for ext_id, desc in python_extensions:
-        install_extension(ext_id, desc)
+    install_extension_group(PYTHON_EXTENSIONS)
 
     # 🤖 Claude Code - Extensões Específicas para IA e ML
     print(
         f"\n{Colors.HEADER}🤖 Instalando extensões específicas para Claude Code...{Colors.ENDC}"
     )
-    claude_extensions = [
-        ("ms-python.black-formatter", "Formatação automática Black"),
-        ("ms-python.flake8", "Linting Flake8"),
-        ("ms-python.mypy-type-checker", "Verificação de tipos MyPy"),
-        ("ms-python.pylint", "Análise de código Pylint"),
-        ("ms-python.autopep8", "Formatação automática PEP 8"),
-    ]
-
-    for ext_id, desc in claude_extensions:
-        install_extension(ext_id, desc)
+    install_extension_group(CLAUDE_EXTENSIONS)
 
     # 📊 Data Science & Jupyter
     print(f"\n{Colors.OKCYAN}📊 Instalando extensões de Data Science...{Colors.ENDC}")
-    ds_extensions = [
-        ("ms-toolsai.jupyter", "Suporte completo ao Jupyter"),
-        ("ms-toolsai.jupyter-keymap", "Atalhos para Jupyter"),
-        ("ms-toolsai.jupyter-renderers", "Renderizadores para diferentes formatos"),
-    ]
-
-    for ext_id, desc in ds_extensions:
-        install_extension(ext_id, desc)
+    install_extension_group(DS_EXTENSIONS)
 
     # 🔧 Development Tools
     print(
         f"\n{Colors.WARNING}🔧 Instalando ferramentas de desenvolvimento...{Colors.ENDC}"
     )
-    dev_extensions = [
-        ("ms-vscode.vscode-json", "Suporte ao JSON"),
-        ("yzhang.markdown-all-in-one", "Editor Markdown avançado"),
-        ("esbenp.prettier-vscode", "Formatador de código"),
-    ]
-
-    for ext_id, desc in dev_extensions:
-        install_extension(ext_id, desc)
+    install_extension_group(DEV_EXTENSIONS)
 
     # 🐳 Docker & Containers
     print(f"\n{Colors.OKBLUE}🐳 Instalando extensões Docker...{Colors.ENDC}")
-    docker_extensions = [
-        ("ms-azuretools.vscode-docker", "Suporte ao Docker"),
-        ("ms-kubernetes-tools.vscode-kubernetes-tools", "Suporte ao Kubernetes"),
-    ]
-
-    for ext_id, desc in docker_extensions:
-        install_extension(ext_id, desc)
+    install_extension_group(DOCKER_EXTENSIONS)
 
     # 🔄 Git & Version Control
     print(f"\n{Colors.OKGREEN}🔄 Instalando extensões Git...{Colors.ENDC}")
-    git_extensions = [
-        ("eamodio.gitlens", "Git supercharged"),
-        ("donjayamanne.githistory", "Histórico Git"),
-        ("github.vscode-github-actions", "GitHub Actions"),
-        ("github.vscode-pull-request-github", "Pull Requests GitHub"),
-        ("vivaxy.vscode-conventional-commits", "Commits convencionais"),
-    ]
-
-    for ext_id, desc in git_extensions:
-        install_extension(ext_id, desc)
+    install_extension_group(GIT_EXTENSIONS)
 
     # 🎨 Themes & Icons
     print(f"\n{Colors.HEADER}🎨 Instalando temas e ícones...{Colors.ENDC}")
-    theme_extensions = [
-        ("pkief.material-icon-theme", "Ícones Material Design"),
-        ("github.github-vscode-theme", "Tema GitHub"),
-        ("johnpapa.vscode-peacock", "Cores personalizadas"),
-    ]
-
-    for ext_id, desc in theme_extensions:
-        install_extension(ext_id, desc)
+    install_extension_group(THEME_EXTENSIONS)
 
     # 🧪 Testing
     print(f"\n{Colors.FAIL}🧪 Instalando extensões de teste...{Colors.ENDC}")
-    test_extensions = [
-        ("littlefoxteam.vscode-python-test-adapter", "Test runner Python"),
-        ("firsttris.vscode-jest-runner", "Test runner Jest"),
-    ]
-
-    for ext_id, desc in test_extensions:
-        install_extension(ext_id, desc)
+    install_extension_group(TEST_EXTENSIONS)
 
     # 🚀 AI & Productivity
     print(
         f"\n{Colors.OKCYAN}🚀 Instalando extensões de IA e produtividade...{Colors.ENDC}"
     )
-    ai_extensions = [
-        ("GitHub.copilot", "Assistente de IA para código"),
-        ("GitHub.copilot-chat", "Chat com IA para desenvolvimento"),
-        ("visualstudioexptteam.vscodeintellicode", "IntelliCode"),
-        ("visualstudioexptteam.intellicode-api-usage-examples", "Exemplos de API"),
-    ]
-
-    for ext_id, desc in ai_extensions:
-        install_extension(ext_id, desc)
+    install_extension_group(AI_EXTENSIONS)
 
     # 🔍 Code Quality & Analysis
     print(
         f"\n{Colors.WARNING}🔍 Instalando extensões de qualidade de código...{Colors.ENDC}"
     )
-    quality_extensions = [
-        ("sonarsource.sonarlint-vscode", "Análise de código SonarLint"),
-        ("streetsidesoftware.code-spell-checker", "Verificador de ortografia"),
-        (
-            "streetsidesoftware.code-spell-checker-portuguese-brazilian",
-            "Português brasileiro",
-        ),
-        ("sourcery.sourcery", "Refatoração automática"),
-    ]
-
-    for ext_id, desc in quality_extensions:
-        install_extension(ext_id, desc)
+    install_extension_group(QUALITY_EXTENSIONS)
 
     # 🎯 Language Support
     print(f"\n{Colors.OKGREEN}🎯 Instalando suporte a linguagens...{Colors.ENDC}")
-    lang_extensions = [
-        ("redhat.vscode-yaml", "Suporte ao YAML"),
-        ("tamasfe.even-better-toml", "Suporte ao TOML"),
-        ("ms-vscode.makefile-tools", "Suporte ao Makefile"),
-        ("naumovs.color-highlight", "Destaque de cores"),
-        ("oderwat.indent-rainbow", "Indentação colorida"),
-    ]
-
-    for ext_id, desc in lang_extensions:
-        install_extension(ext_id, desc)
+    install_extension_group(LANG_EXTENSIONS)
 
     # 🛠️ Utilities
     print(f"\n{Colors.OKBLUE}🛠️ Instalando utilitários...{Colors.ENDC}")
-    util_extensions = [
-        ("chakrounanas.turbo-console-log", "Console log rápido"),
-        ("christian-kohler.path-intellisense", "Autocompletar de caminhos"),
-        ("gruntfuggly.todo-tree", "Árvore de TODOs"),
-        ("wallabyjs.quokka-vscode", "Quokka.js"),
-        ("xyz.local-history", "Histórico local"),
-    ]
-
-    for ext_id, desc in util_extensions:
-        install_extension(ext_id, desc)
+    install_extension_group(UTIL_EXTENSIONS)
 
     # 🌐 Web Development
     print(
         f"\n{Colors.OKBLUE}🌐 Instalando extensões de desenvolvimento web...{Colors.ENDC}"
     )
-    web_extensions = [
-        ("ms-vscode.live-server", "Live Server"),
-        ("vue.volar", "Suporte ao Vue"),
-        ("zignd.html-css-class-completion", "Autocompletar CSS"),
-    ]
-
-    for ext_id, desc in web_extensions:
-        install_extension(ext_id, desc)
+    install_extension_group(WEB_EXTENSIONS)
 
     # 📊 Database & APIs
     print(
         f"\n{Colors.OKCYAN}📊 Instalando extensões de banco de dados e APIs...{Colors.ENDC}"
     )
-    db_extensions = [
-        ("cweijan.dbclient-jdbc", "Cliente JDBC"),
-        ("cweijan.vscode-redis-client", "Cliente Redis"),
-        ("humao.rest-client", "Cliente REST"),
-    ]
-
-    for ext_id, desc in db_extensions:
-        install_extension(ext_id, desc)
+    install_extension_group(DB_EXTENSIONS)
 
     # 🔧 Advanced Tools
     print(f"\n{Colors.WARNING}🔧 Instalando ferramentas avançadas...{Colors.ENDC}")
-    advanced_extensions = [
-        ("adpyke.codesnap", "Captura de código"),
-        ("jebbs.plantuml", "PlantUML"),
-        ("quicktype.quicktype", "QuickType"),
-        ("tim-koehler.helm-intellisense", "Helm IntelliSense"),
-    ]
-
-    for ext_id, desc in advanced_extensions:
-        install_extension(ext_id, desc)
+    install_extension_group(ADVANCED_EXTENSIONS)
 
 
 def print_next_steps():
@@ -5,10 +5,18 @@ Script Python cross-platform para instalação automática das extensões essenc
 Baseado nas suas configurações pessoais do VSCode
 """
 
+import os
 import subprocess
 import sys
-import platform
-import time
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+from _extensions import ALL_EXTENSIONS
+
+# Instalações são limitadas por I/O (cada uma inicia o CLI do VS Code)
+MAX_INSTALL_WORKERS = min(8, os.cpu_count() or 4)
+
+_print_lock = threading.Lock()
 
 
 # Cores para output (ANSI escape codes)
@@ -22,7 +30,9 @@ class Colors:
 
 def print_colored(text: str, color: str) -> None:
     """Imprime texto colorido"""
-    print(f"{color}{text}{Colors.NC}")
+    line = "".join((color, text, Colors.NC, "\n"))
+    with _print_lock:
+        sys.stdout.write(line)
 
 
 def check_code_installed() -> bool:
@@ -36,6 +46,17 @@ def check_code_installed() -> bool:
         return False
 
 
+def get_installed_extensions() -> set[str]:
+    """Retorna os ids (em minúsculas) das extensões já instaladas"""
+    try:
+        result = subprocess.run(
+            ["code", "--list-extensions"], capture_output=True, text=True, check=True
+        )
+    except subprocess.CalledProcessError:
+        return set()
+    return {extension.lower() for extension in result.stdout.split()}
+
+
 def install_extension(extension: str, force: bool = False) -> bool:
     """Instala uma extensão específica"""
     try:
@@ -49,78 +70,24 @@ def install_extension(extension: str, force: bool = False) -> bool:
         return False
 
 
+def install_extensions_batch(extensions: list[str], force: bool = False) -> bool:
+    """Instala várias extensões em uma única chamada do CLI"""
+    cmd = ["code"]
+    for extension in extensions:
+        cmd += ["--install-extension", extension]
+    if force:
+        cmd.append("--force")
+
+    try:
+        subprocess.run(cmd, capture_output=True, text=True, check=True)
+        return True
+    except subprocess.CalledProcessError:
+        return False
+
+
 def get_extensions() -> list[str]:
     """Retorna a lista de extensões essenciais baseada nas suas configurações"""
-    return [
-        # 🐍 Python Development
-        "ms-python.python",
-        "ms-python.vscode-pylance",
-        "ms-python.debugpy",
-        "ms-python.isort",
-        "charliermarsh.ruff",
-        # 📊 Data Science & Jupyter
-        "ms-toolsai.jupyter",
-        "ms-toolsai.jupyter-keymap",
-        # 🔧 Development Tools
-        "ms-vscode.vscode-json",
-        "yzhang.markdown-all-in-one",
-        "esbenp.prettier-vscode",
-        "ms-vscode.vscode-typescript-next",
-        "bradlc.vscode-tailwindcss",
-        # 🐳 Docker & Containers
-        "ms-azuretools.vscode-docker",
-        "ms-kubernetes-tools.vscode-kubernetes-tools",
-        # 🔄 Git & Version Control
-        "eamodio.gitlens",
-        "donjayamanne.githistory",
-        "github.vscode-github-actions",
-        "github.vscode-pull-request-github",
-        "vivaxy.vscode-conventional-commits",
-        # 🎨 Themes & Icons
-        "pkief.material-icon-theme",
-        "github.github-vscode-theme",
-        "johnpapa.vscode-peacock",
-        # 🧪 Testing
-        "littlefoxteam.vscode-python-test-adapter",
-        "firsttris.vscode-jest-runner",
-        "orta.vscode-jest",
-        "vitest.explorer",
-        # 🚀 AI & Productivity
-        "GitHub.copilot",
-        "GitHub.copilot-chat",
-        "visualstudioexptteam.vscodeintellicode",
-        "visualstudioexptteam.intellicode-api-usage-examples",
-        # 🔍 Code Quality & Analysis
-        "sonarsource.sonarlint-vscode",
-        "streetsidesoftware.code-spell-checker",
-        "streetsidesoftware.code-spell-checker-portuguese-brazilian",
-        "sourcery.sourcery",
-        # 🎯 Language Support
-        "redhat.vscode-yaml",
-        "tamasfe.even-better-toml",
-        "ms-vscode.makefile-tools",
-        "naumovs.color-highlight",
-        "oderwat.indent-rainbow",
-        # 🛠️ Utilities
-        "chakrounanas.turbo-console-log",
-        "christian-kohler.path-intellisense",
-        "gruntfuggly.todo-tree",
-        "wallabyjs.quokka-vscode",
-        "xyz.local-history",
-        # 🌐 Web Development
-        "ms-vscode.live-server",
-        "vue.volar",
-        "zignd.html-css-class-completion",
-        # 📊 Database & APIs
-        "cweijan.dbclient-jdbc",
-        "cweijan.vscode-redis-client",
-        "humao.rest-client",
-        # 🔧 Advanced Tools
-        "adpyke.codesnap",
-        "jebbs.plantuml",
-        "quicktype.quicktype",
-        "tim-koehler.helm-intellisense",
-    ]
+    return sorted({extension for extension, _ in ALL_EXTENSIONS})
 
 
 def main():
@@ -147,27 +114,47 @@ def main():
     installed = 0
     failed = 0
 
-    print_colored(f"📦 Total de extensões a instalar: {total}", Colors.BLUE)
-    print()
+    # Pular as extensões que já estão instaladas
+    already_installed = get_installed_extensions()
+    extensions = [e for e in extensions if e.lower() not in already_installed]
+    skipped = total - len(extensions)
 
-    # Instalar cada extensão
-    for extension in extensions:
-        print(f"📥 Instalando {extension}... ", end="")
+    print_colored(f"📦 Total de extensões: {total}", Colors.BLUE)
+    print_colored(f"⏭️  Já instaladas: {skipped}", Colors.BLUE)
+    print_colored(f"📥 A instalar: {len(extensions)}", Colors.BLUE)
+    print()
 
-        if install_extension(extension, force=True):
-            print_colored("✅ Sucesso", Colors.GREEN)
-            installed += 1
-        else:
-            print_colored("❌ Falha", Colors.RED)
-            failed += 1
+    # Uma única chamada do CLI evita reiniciá-lo para cada extensão
+    if extensions and install_extensions_batch(extensions, force=True):
+        print_colored("✅ Extensões instaladas em lote", Colors.GREEN)
+        installed = len(extensions)
+        extensions = []
+    elif extensions:
+        print_colored(
+            "⚠️  Instalação em lote falhou, instalando individualmente...",
+            Colors.YELLOW,
+        )
 
-        # Pequena pausa para evitar sobrecarga
-        time.sleep(0.5)
+    # Instalar as extensões restantes em paralelo, reportando conforme terminam
+    with ThreadPoolExecutor(max_workers=MAX_INSTALL_WORKERS) as pool:
+        futures = {
+            pool.submit(install_extension, extension, True): extension
+            for extension in extensions
+        }
+        for future in as_completed(futures):
+            extension = futures[future]
+            if future.result():
+                print_colored(f"📥 {extension}... ✅ Sucesso", Colors.GREEN)
+                installed += 1
+            else:
+                print_colored(f"📥 {extension}... ❌ Falha", Colors.RED)
+                failed += 1
 
     # Resumo
     print()
     print_colored("📊 Resumo da instalação:", Colors.BLUE)
     print_colored(f"✅ Instaladas com sucesso: {installed}", Colors.GREEN)
+    print_colored(f"⏭️  Já instaladas: {skipped}", Colors.BLUE)
     print_colored(f"❌ Falhas: {failed}", Colors.RED)
     print_colored(f"📦 Total: {total}", Colors.BLUE)
 
@@ -199,6 +186,8 @@ def main():
     print("5. Aproveite suas configurações personalizadas! 🎨")
 
     # Informações específicas do sistema
+    import platform
+
     system = platform.system()
     if system == "Windows":
         print_colored(
@@ -222,7 +222,10 @@ setup_mlflow_server() {
             --cpu=1 \
             --set-env-vars="MLFLOW_TRACKING_URI=http://localhost:5000" \
             --set-env-vars="GOOGLE_CLOUD_PROJECT=$GOOGLE_CLOUD_PROJECT" \
-            --set-env-vars="GCS_BUCKET_NAME=$GCS_BUCKET_NAME"
+            --set-env-vars="GCS_BUCKET_NAME=$GCS_BUCKET_NAME" \
+            --set-env-vars="MLFLOW_DEFAULT_ARTIFACT_ROOT=gs://$GCS_BUCKET_NAME/mlflow-artifacts" \
+            ${CLOUD_SQL_INSTANCE:+--add-cloudsql-instances="$CLOUD_SQL_INSTANCE"} \
+            ${DATABASE_URL:+--set-env-vars="DATABASE_URL=$DATABASE_URL"}
 
         local mlflow_url=$(gcloud run services describe mlflow-server \
             --platform=managed \
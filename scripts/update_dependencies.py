@@ -6,23 +6,24 @@ Este script atualiza as dependências Python para versões mais seguras.
 
 import subprocess
 import sys
-import os
 from pathlib import Path
 
 
 def run_command(command, description):
-    """Executa um comando e trata erros."""
+    """Executa um comando (lista de argumentos, sem shell) e trata erros."""
     print(f"🔄 {description}...")
     try:
-        result = subprocess.run(
-            command, shell=True, check=True, capture_output=True, text=True
-        )
+        result = subprocess.run(command, check=True, capture_output=True, text=True)
         print(f"✅ {description} concluído com sucesso")
         return result.stdout
     except subprocess.CalledProcessError as e:
         print(f"❌ Erro ao {description.lower()}: {e}")
         print(f"Stderr: {e.stderr}")
         return None
+    except FileNotFoundError as e:
+        # Sem shell, um executável ausente não gera código de saída 127
+        print(f"❌ Erro ao {description.lower()}: {e}")
+        return None
 
 
 def main():
@@ -37,33 +38,33 @@ def main():
         sys.exit(1)
 
     # Verificar se uv está instalado
-    if run_command("uv --version", "Verificando versão do uv") is None:
+    if run_command(["uv", "--version"], "Verificando versão do uv") is None:
         print("❌ Erro: uv não está instalado ou não está no PATH")
         sys.exit(1)
 
     # Atualizar dependências
     print("\n📦 Atualizando dependências...")
 
-    # Remover arquivo de lock antigo
-    if Path("uv.lock").exists():
-        os.remove("uv.lock")
-        print("🗑️  Arquivo uv.lock removido")
+    # Resolver novamente todas as versões (o uv reescreve o lock atomicamente)
+    if run_command(["uv", "lock", "--upgrade"], "Atualizando uv.lock") is None:
+        print("❌ Falha ao atualizar o uv.lock")
+        sys.exit(1)
 
     # Sincronizar dependências
-    if run_command("uv sync", "Sincronizando dependências com uv") is None:
+    if run_command(["uv", "sync"], "Sincronizando dependências com uv") is None:
         print("❌ Falha ao sincronizar dependências")
         sys.exit(1)
 
     # Verificar vulnerabilidades
     print("\n🔍 Verificando vulnerabilidades...")
-    if run_command("uv pip audit", "Executando auditoria de segurança") is None:
+    if run_command(["uv", "pip", "audit"], "Executando auditoria de segurança") is None:
         print("⚠️  Não foi possível executar auditoria de segurança")
 
     # Regenerar requirements.txt
     print("\n📝 Regenerando requirements.txt...")
     if (
         run_command(
-            "uv export --frozen --output-file=requirements.txt",
+            ["uv", "export", "--frozen", "--output-file=requirements.txt"],
             "Exportando requirements.txt",
         )
         is None
@@ -6,20 +6,144 @@ Este módulo gerencia todas as configurações relacionadas à AWS para treiname
 de modelos de detecção de anomalias na cloud.
 """
 
+import copy
 import logging
 import os
+import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
+from functools import cache, lru_cache
 from pathlib import Path
 from typing import Any
 
 import boto3
 import yaml
+from boto3.s3.transfer import TransferConfig
+from botocore.config import Config
 from botocore.exceptions import ClientError, NoCredentialsError
 
+# Parser YAML em C (LibYAML) quando disponível, com fallback para o puro Python
+try:
+    from yaml import CSafeLoader as YamlLoader
+except ImportError:
+    from yaml import SafeLoader as YamlLoader
+
 # Configuração de logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Configuração compartilhada pelos clientes: pool de conexões maior e retries
+# adaptativos para suavizar o throttling das APIs AWS
+CLIENT_CONFIG = Config(
+    max_pool_connections=50, retries={"mode": "adaptive", "max_attempts": 10}
+)
+
+
+# Parâmetros da sessão padrão do boto3 configurada pelos gerenciadores
+_default_session_kwargs: dict[str, str] | None = None
+# Protege a sessão padrão: tanto reconfigurá-la quanto criar clientes a
+# partir dela não são operações thread-safe no boto3
+_default_session_lock = threading.Lock()
+
+
+@cache
+def get_aws_client(service_name: str):
+    """
+    Retorna um cliente boto3 compartilhado no processo.
+
+    Criar um cliente carrega o modelo JSON do serviço e abre um novo pool de
+    conexões HTTPS; com o cache, cada serviço é criado uma única vez e
+    reutilizado por todos os gerenciadores.
+
+    Args:
+        service_name: Nome do serviço AWS (s3, sagemaker, ...)
+
+    Returns:
+        Cliente boto3 do serviço
+    """
+    with _default_session_lock:
+        return boto3.client(service_name, config=CLIENT_CONFIG)
+
+
+def _configure_default_session(**session_kwargs: str) -> None:
+    """
+    Configura a sessão padrão do boto3 apenas quando as credenciais mudam.
+
+    Recriar a sessão repete a resolução de credenciais e obriga a recriar
+    todos os clientes em cache; gerenciadores criados com a mesma
+    configuração (notebooks, testes, threads) reaproveitam a sessão e os
+    clientes existentes.
+    """
+    global _default_session_kwargs
+    with _default_session_lock:
+        if session_kwargs == _default_session_kwargs:
+            return
+        boto3.setup_default_session(**session_kwargs)
+        # Nova sessão invalida os clientes criados com as credenciais antigas
+        get_aws_client.cache_clear()
+        _default_session_kwargs = session_kwargs
+
+
+# Pastas padrão do bucket, registradas no manifesto S3_FOLDERS_MANIFEST
+# (por setup_s3_structure e pelo script gerado em generate_setup_script)
+S3_FOLDERS = (
+    "data/",
+    "models/",
+    "experiments/",
+    "logs/",
+    "checkpoints/",
+    "datasets/",
+    "mlflow-artifacts/",
+    "tensorboard-logs/",
+)
+S3_FOLDERS_MANIFEST = ".folders"
+
+# Linha "CHAVE=valor" do .env: ignora linhas vazias e comentários e remove os
+# espaços ao redor da chave e do valor (o valor pode conter "=")
+ENV_LINE_PATTERN = re.compile(
+    r"^[^\S\n]*([^#=\s][^=\n]*?)[^\S\n]*=[^\S\n]*(.*?)[^\S\n]*$", re.MULTILINE
+)
+
+
+@lru_cache(maxsize=8)
+def _parse_yaml_config(text: str) -> Any:
+    """
+    Interpreta o YAML de configuração, com cache pelo conteúdo do arquivo.
+
+    Ler o arquivo é barato; o parse não. Gerenciadores criados repetidamente
+    (notebooks, handlers, threads) reaproveitam o resultado enquanto o
+    conteúdo não mudar.
+    """
+    return yaml.load(text, Loader=YamlLoader)
+
+
+class _LazyClient:
+    """
+    Atributo de cliente boto3 criado apenas no primeiro acesso.
+
+    A maioria dos usos do gerenciador (ler configurações, gerar scripts) não
+    toca nenhum serviço, e cada cliente carrega o modelo JSON do seu serviço.
+    Atribuir ao atributo substitui o cliente (útil em testes).
+    """
+
+    def __init__(self, service_name: str):
+        self.service_name = service_name
+
+    def __set_name__(self, owner, name):
+        self.name = name
+
+    def __get__(self, instance, owner=None):
+        if instance is None:
+            return self
+        clients = instance._clients
+        if self.name not in clients:
+            clients[self.name] = instance._create_client(self.service_name)
+        return clients[self.name]
+
+    def __set__(self, instance, value):
+        instance._clients[self.name] = value
+
 
 @dataclass
 class AWSConfig:
@@ -56,6 +180,13 @@ class S3Config:
 class AWSConfigManager:
     """Gerenciador de configurações AWS para o projeto."""
 
+    s3_client = _LazyClient("s3")
+    sagemaker_client = _LazyClient("sagemaker")
+    ec2_client = _LazyClient("ec2")
+    cloudwatch_client = _LazyClient("cloudwatch")
+    iam_client = _LazyClient("iam")
+    sts_client = _LazyClient("sts")
+
     def __init__(
         self, config_path: str = "aws-config.yaml", env_path: str = ".env.aws"
     ):
@@ -75,7 +206,7 @@ class AWSConfigManager:
         self._load_config()
         self._load_env_vars()
 
-        # Inicializa clientes AWS
+        # Configura a sessão AWS (clientes criados no primeiro uso)
         self._init_aws_clients()
 
     def _load_config(self) -> None:
@@ -83,7 +214,9 @@ class AWSConfigManager:
         try:
             if self.config_path.exists():
                 with open(self.config_path, encoding="utf-8") as f:
-                    self.config = yaml.safe_load(f)
+                    text = f.read()
+                # Cópia: o resultado em cache é compartilhado entre instâncias
+                self.config = copy.deepcopy(_parse_yaml_config(text))
                 logger.info(f"Configuração carregada de {self.config_path}")
             else:
                 logger.warning(
@@ -99,11 +232,9 @@ class AWSConfigManager:
         try:
             if self.env_path.exists():
                 with open(self.env_path, encoding="utf-8") as f:
-                    for line in f:
-                        line = line.strip()
-                        if line and not line.startswith("#") and "=" in line:
-                            key, value = line.split("=", 1)
-                            self.env_vars[key.strip()] = value.strip()
+                    content = f.read()
+                # Uma única passada da regex (em C) sobre o arquivo inteiro
+                self.env_vars = dict(ENV_LINE_PATTERN.findall(content))
                 logger.info(f"Variáveis de ambiente carregadas de {self.env_path}")
             else:
                 logger.warning(
@@ -115,62 +246,62 @@ class AWSConfigManager:
             self.env_vars = {}
 
     def _init_aws_clients(self) -> None:
-        """Inicializa clientes AWS."""
+        """Configura a sessão AWS; os clientes são criados sob demanda."""
+        self._clients: dict[str, Any] = {}
         try:
             # Configura credenciais
             if self.env_vars.get("AWS_ACCESS_KEY_ID") and self.env_vars.get(
                 "AWS_SECRET_ACCESS_KEY"
             ):
-                boto3.setup_default_session(
+                _configure_default_session(
                     aws_access_key_id=self.env_vars["AWS_ACCESS_KEY_ID"],
                     aws_secret_access_key=self.env_vars["AWS_SECRET_ACCESS_KEY"],
                     region_name=self.env_vars.get("AWS_REGION", "us-east-1"),
                 )
             elif self.env_vars.get("AWS_PROFILE"):
-                boto3.setup_default_session(profile_name=self.env_vars["AWS_PROFILE"])
+                _configure_default_session(profile_name=self.env_vars["AWS_PROFILE"])
 
-            # Inicializa clientes
-            self.s3_client = boto3.client("s3")
-            self.sagemaker_client = boto3.client("sagemaker")
-            self.ec2_client = boto3.client("ec2")
-            self.cloudwatch_client = boto3.client("cloudwatch")
-            self.iam_client = boto3.client("iam")
+            logger.info("Sessão AWS configurada")
 
-            logger.info("Clientes AWS inicializados com sucesso")
+        except Exception as e:
+            logger.error(f"Erro ao configurar sessão AWS: {e}")
 
+    def _create_client(self, service_name: str):
+        """Cria o cliente de um serviço, ou None se a criação falhar."""
+        try:
+            return get_aws_client(service_name)
         except NoCredentialsError:
             logger.error("Credenciais AWS não encontradas")
-            self.s3_client = None
-            self.sagemaker_client = None
-            self.ec2_client = None
-            self.cloudwatch_client = None
-            self.iam_client = None
         except Exception as e:
-            logger.error(f"Erro ao inicializar clientes AWS: {e}")
-            self.s3_client = None
-            self.sagemaker_client = None
-            self.ec2_client = None
-            self.cloudwatch_client = None
-            self.iam_client = None
+            logger.error(f"Erro ao inicializar cliente AWS {service_name}: {e}")
+        return None
 
     def validate_aws_credentials(self) -> bool:
         """
         Valida as credenciais AWS.
 
+        Usa ``sts:GetCallerIdentity``, que responde em uma única requisição
+        pequena e não exige permissões, em vez de ``s3:ListBuckets``, cuja
+        resposta cresce com o número de buckets da conta.
+
         Returns:
             True se as credenciais são válidas, False caso contrário
         """
         try:
-            if not self.s3_client:
+            if not self.sts_client:
                 return False
 
-            # Tenta listar buckets para validar credenciais
-            self.s3_client.list_buckets()
-            logger.info("Credenciais AWS validadas com sucesso")
+            identity = self.sts_client.get_caller_identity()
+            logger.info(
+                f"Credenciais AWS validadas com sucesso (conta {identity.get('Account')})"
+            )
             return True
 
         except ClientError as e:
-            if e.response["Error"]["Code"] == "InvalidAccessKeyId":
+            if e.response["Error"]["Code"] in (
+                "InvalidAccessKeyId",
+                "InvalidClientTokenId",
+            ):
                 logger.error("Access Key ID inválida")
             elif e.response["Error"]["Code"] == "SignatureDoesNotMatch":
                 logger.error("Secret Access Key inválida")
@@ -251,10 +382,127 @@ class AWSConfigManager:
             logger.error(f"Erro ao criar bucket S3: {e}")
             return False
 
+    def create_express_bucket(
+        self,
+        availability_zone_id: str | None = None,
+        bucket_name: str | None = None,
+    ) -> str | None:
+        """
+        Cria um bucket S3 Express One Zone (directory bucket) para dados de treino.
+
+        Args:
+            availability_zone_id: ID da zona de disponibilidade (ex: use1-az4)
+            bucket_name: Nome base do bucket (usa configuração padrão se None)
+
+        Returns:
+            Nome completo do directory bucket ou None se erro
+        """
+        try:
+            if not self.s3_client:
+                logger.error("Cliente S3 não inicializado")
+                return None
+
+            s3_config = self.config.get("s3", {})
+            availability_zone_id = availability_zone_id or s3_config.get(
+                "express_one_zone", {}
+            ).get("availability_zone_id")
+            bucket_name = bucket_name or s3_config.get("bucket_name")
+            if not bucket_name or not availability_zone_id:
+                logger.error(
+                    "Nome do bucket ou zona de disponibilidade não especificados"
+                )
+                return None
+
+            # Directory buckets exigem o sufixo --<az-id>--x-s3
+            express_bucket = f"{bucket_name}--{availability_zone_id}--x-s3"
+
+            try:
+                self.s3_client.head_bucket(Bucket=express_bucket)
+                logger.info(f"Bucket S3 Express {express_bucket} já existe")
+                return express_bucket
+            except ClientError as e:
+                if e.response["Error"]["Code"] not in ("404", "NoSuchBucket"):
+                    raise
+
+            self.s3_client.create_bucket(
+                Bucket=express_bucket,
+                CreateBucketConfiguration={
+                    "Location": {
+                        "Type": "AvailabilityZone",
+                        "Name": availability_zone_id,
+                    },
+                    "Bucket": {
+                        "Type": "Directory",
+                        "DataRedundancy": "SingleAvailabilityZone",
+                    },
+                },
+            )
+
+            logger.info(f"Bucket S3 Express {express_bucket} criado com sucesso")
+            return express_bucket
+
+        except Exception as e:
+            logger.error(f"Erro ao criar bucket S3 Express: {e}")
+            return None
+
+    def _get_transfer_config(self) -> TransferConfig:
+        """Monta a configuração de transferência S3 a partir do YAML."""
+        transfer_config = self.config.get("s3", {}).get("transfer", {})
+        return TransferConfig(
+            preferred_transfer_client=transfer_config.get(
+                "preferred_transfer_client", "auto"
+            ),
+            multipart_chunksize=transfer_config.get("multipart_chunksize_mb", 8)
+            * 1024
+            * 1024,
+            max_concurrency=transfer_config.get("max_concurrency", 10),
+        )
+
+    def upload_file(
+        self, local_path: str, key: str, bucket_name: str | None = None
+    ) -> bool:
+        """
+        Envia um arquivo local para o S3.
+
+        Usa o gerenciador de transferência do AWS CRT quando disponível
+        (``pip install "boto3[crt]"``), com fallback para o cliente clássico.
+
+        Args:
+            local_path: Caminho do arquivo local
+            key: Chave de destino no bucket
+            bucket_name: Nome do bucket (usa configuração padrão se None)
+
+        Returns:
+            True se o arquivo foi enviado, False caso contrário
+        """
+        try:
+            if not self.s3_client:
+                logger.error("Cliente S3 não inicializado")
+                return False
+
+            bucket_name = bucket_name or self.config.get("s3", {}).get("bucket_name")
+            if not bucket_name:
+                logger.error("Nome do bucket não especificado")
+                return False
+
+            self.s3_client.upload_file(
+                local_path, bucket_name, key, Config=self._get_transfer_config()
+            )
+
+            logger.info(f"Arquivo {local_path} enviado para s3://{bucket_name}/{key}")
+            return True
+
+        except Exception as e:
+            logger.error(f"Erro ao enviar arquivo {local_path} para o S3: {e}")
+            return False
+
     def setup_s3_structure(self, bucket_name: str | None = None) -> bool:
         """
         Configura estrutura de pastas no S3.
 
+        Os prefixos não precisam existir previamente no S3; o método apenas
+        registra a estrutura esperada no objeto ``.folders`` do bucket.
+
         Args:
             bucket_name: Nome do bucket (usa configuração padrão se None)
 
@@ -267,24 +515,14 @@ class AWSConfigManager:
                 logger.error("Nome do bucket não especificado")
                 return False
 
-            # Pastas padrão
-            folders = [
-                "data/",
-                "models/",
-                "experiments/",
-                "logs/",
-                "checkpoints/",
-                "datasets/",
-                "mlflow-artifacts/",
-                "tensorboard-logs/",
-            ]
-
-            for folder in folders:
-                try:
-                    self.s3_client.put_object(Bucket=bucket_name, Key=folder, Body="")
-                    logger.info(f"Pasta {folder} criada no bucket {bucket_name}")
-                except Exception as e:
-                    logger.warning(f"Erro ao criar pasta {folder}: {e}")
+            # No S3 as "pastas" são apenas prefixos e surgem com o primeiro
+            # objeto; em vez de um objeto vazio por pasta (uma requisição
+            # cada), grava um único manifesto com os prefixos esperados
+            self.s3_client.put_object(
+                Bucket=bucket_name,
+                Key=S3_FOLDERS_MANIFEST,
+                Body="\n".join(S3_FOLDERS).encode(),
+            )
 
             logger.info(f"Estrutura S3 configurada no bucket {bucket_name}")
             return True
@@ -320,48 +558,29 @@ class AWSConfigManager:
             )
             role_arn = self.env_vars.get("SAGEMAKER_ROLE_ARN")
 
-            # Valida domínio
-            if domain_name:
-                try:
-                    self.sagemaker_client.describe_domain(DomainName=domain_name)
-                    result["domain_exists"] = True
-                    logger.info(f"Domínio SageMaker {domain_name} encontrado")
-                except ClientError as e:
-                    if e.response["Error"]["Code"] == "ValidationException":
-                        logger.warning(
-                            f"Domínio SageMaker {domain_name} não encontrado"
-                        )
-                    else:
-                        logger.error(f"Erro ao verificar domínio: {e}")
-
-            # Valida perfil de usuário
-            if user_profile_name:
-                try:
-                    self.sagemaker_client.describe_user_profile(
-                        DomainName=domain_name, UserProfileName=user_profile_name
+            # As três verificações são independentes: executa em paralelo,
+            # e o tempo total passa a ser o da chamada mais lenta. Os clientes
+            # são resolvidos aqui, antes das threads, pois criá-los a partir
+            # da sessão padrão do boto3 não é thread-safe.
+            iam_client = self.iam_client if role_arn else None
+            checks = {}
+            with ThreadPoolExecutor(max_workers=3) as executor:
+                if domain_name:
+                    checks["domain_exists"] = executor.submit(
+                        self._check_sagemaker_domain, domain_name
+                    )
+                if user_profile_name:
+                    checks["user_profile_exists"] = executor.submit(
+                        self._check_sagemaker_user_profile,
+                        domain_name,
+                        user_profile_name,
                     )
-                    result["user_profile_exists"] = True
-                    logger.info(f"Perfil de usuário {user_profile_name} encontrado")
-                except ClientError as e:
-                    if e.response["Error"]["Code"] == "ValidationException":
-                        logger.warning(
-                            f"Perfil de usuário {user_profile_name} não encontrado"
-                        )
-                    else:
-                        logger.error(f"Erro ao verificar perfil de usuário: {e}")
-
-            # Valida role IAM
-            if role_arn:
-                try:
-                    role_name = role_arn.split("/")[-1]
-                    self.iam_client.get_role(RoleName=role_name)
-                    result["role_exists"] = True
-                    logger.info(f"Role IAM {role_name} encontrada")
-                except ClientError as e:
-                    if e.response["Error"]["Code"] == "NoSuchEntity":
-                        logger.warning(f"Role IAM {role_name} não encontrada")
-                    else:
-                        logger.error(f"Erro ao verificar role IAM: {e}")
+                if role_arn:
+                    checks["role_exists"] = executor.submit(
+                        self._check_iam_role, iam_client, role_arn
+                    )
+            for key, future in checks.items():
+                result[key] = future.result()
 
             # Determina se tudo está válido
             result["valid"] = all(
@@ -378,6 +597,50 @@ class AWSConfigManager:
             logger.error(f"Erro ao validar SageMaker: {e}")
             return result
 
+    def _check_sagemaker_domain(self, domain_name: str) -> bool:
+        """Verifica se o domínio SageMaker existe."""
+        try:
+            self.sagemaker_client.describe_domain(DomainName=domain_name)
+            logger.info(f"Domínio SageMaker {domain_name} encontrado")
+            return True
+        except ClientError as e:
+            if e.response["Error"]["Code"] == "ValidationException":
+                logger.warning(f"Domínio SageMaker {domain_name} não encontrado")
+            else:
+                logger.error(f"Erro ao verificar domínio: {e}")
+            return False
+
+    def _check_sagemaker_user_profile(
+        self, domain_name: str | None, user_profile_name: str
+    ) -> bool:
+        """Verifica se o perfil de usuário SageMaker existe."""
+        try:
+            self.sagemaker_client.describe_user_profile(
+                DomainName=domain_name, UserProfileName=user_profile_name
+            )
+            logger.info(f"Perfil de usuário {user_profile_name} encontrado")
+            return True
+        except ClientError as e:
+            if e.response["Error"]["Code"] == "ValidationException":
+                logger.warning(f"Perfil de usuário {user_profile_name} não encontrado")
+            else:
+                logger.error(f"Erro ao verificar perfil de usuário: {e}")
+            return False
+
+    def _check_iam_role(self, iam_client, role_arn: str) -> bool:
+        """Verifica se a role IAM existe."""
+        role_name = role_arn.split("/")[-1]
+        try:
+            iam_client.get_role(RoleName=role_name)
+            logger.info(f"Role IAM {role_name} encontrada")
+            return True
+        except ClientError as e:
+            if e.response["Error"]["Code"] == "NoSuchEntity":
+                logger.warning(f"Role IAM {role_name} não encontrada")
+            else:
+                logger.error(f"Erro ao verificar role IAM: {e}")
+            return False
+
     def get_training_config(self, model_name: str) -> dict[str, Any]:
         """
         Obtém configuração de treinamento para um modelo específico.
@@ -484,6 +747,13 @@ class AWSConfigManager:
             True se o script foi gerado, False caso contrário
         """
         try:
+            s3_config = self.config.get("s3", {})
+            bucket_name = s3_config.get("bucket_name", "petrobras-anomaly-detection")
+            s3_region = s3_config.get("region", "us-east-1")
+            aws_region = self.config.get("aws", {}).get("region", "us-east-1")
+            # "\n" literal: o printf do script gera as quebras de linha
+            folders_manifest = "\\n".join(S3_FOLDERS)
+
             script_content = f"""#!/bin/bash
 # Script de Setup AWS para Petrobras Offshore Wells Anomaly Detection
 # Gerado automaticamente pelo AWSConfigManager
@@ -505,24 +775,19 @@ fi
 echo "🔐 Configurando credenciais AWS..."
 aws configure set aws_access_key_id ${{AWS_ACCESS_KEY_ID}}
 aws configure set aws_secret_access_key ${{AWS_SECRET_ACCESS_KEY}}
-aws configure set region {self.config.get("aws", {}).get("region", "us-east-1")}
+aws configure set region {aws_region}
 
 # Cria bucket S3
 echo "🪣 Criando bucket S3..."
-aws s3 mb s3://{self.config.get("s3", {}).get("bucket_name", "petrobras-anomaly-detection")} --region {self.config.get("s3", {}).get("region", "us-east-1")}
+aws s3 mb s3://{bucket_name} --region {s3_region}
 
 # Configura versionamento do bucket
 echo "📝 Configurando versionamento do bucket..."
-aws s3api put-bucket-versioning --bucket {self.config.get("s3", {}).get("bucket_name", "petrobras-anomaly-detection")} --versioning-configuration Status=Enabled
-
-# Cria estrutura de pastas
-echo "📁 Criando estrutura de pastas..."
-aws s3api put-object --bucket {self.config.get("s3", {}).get("bucket_name", "petrobras-anomaly-detection")} --key data/
-aws s3api put-object --bucket {self.config.get("s3", {}).get("bucket_name", "petrobras-anomaly-detection")} --key models/
-aws s3api put-object --bucket {self.config.get("s3", {}).get("bucket_name", "petrobras-anomaly-detection")} --key experiments/
-aws s3api put-object --bucket {self.config.get("s3", {}).get("bucket_name", "petrobras-anomaly-detection")} --key logs/
-aws s3api put-object --bucket {self.config.get("s3", {}).get("bucket_name", "petrobras-anomaly-detection")} --key checkpoints/
-aws s3api put-object --bucket {self.config.get("s3", {}).get("bucket_name", "petrobras-anomaly-detection")} --key datasets/
+aws s3api put-bucket-versioning --bucket {bucket_name} --versioning-configuration Status=Enabled
+
+# Registra a estrutura de pastas (um único manifesto, como setup_s3_structure)
+echo "📁 Registrando estrutura de pastas..."
+printf '{folders_manifest}' | aws s3 cp - s3://{bucket_name}/{S3_FOLDERS_MANIFEST}
 
 echo "✅ Setup AWS concluído com sucesso!"
 echo "📋 Próximos passos:"
@@ -6,13 +6,16 @@ Este módulo implementa o treinamento de modelos de detecção de anomalias
 usando Amazon SageMaker e EC2 para treinamento distribuído.
 """
 
+import copy
 import logging
 import time
+from collections.abc import Iterator, Sequence
 from dataclasses import dataclass
+from itertools import islice
 from pathlib import Path
 from typing import Any
 
-import boto3
+import numpy as np
 import sagemaker
 from sagemaker import get_execution_role
 from sagemaker.pytorch import PyTorch
@@ -23,10 +26,35 @@ from sagemaker.tuner import (
     IntegerParameter,
 )
 
+from .aws_config_manager import get_aws_client
+
 # Configuração de logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Preços por hora (aproximados, podem variar)
+INSTANCE_HOURLY_PRICING = {
+    "ml.p3.2xlarge": 3.06,  # 1x V100
+    "ml.p3.8xlarge": 12.24,  # 4x V100
+    "ml.p3.16xlarge": 24.48,  # 8x V100
+    "ml.g4dn.xlarge": 0.526,  # 1x T4
+    "ml.g4dn.2xlarge": 0.736,  # 1x T4
+    "ml.g4dn.4xlarge": 1.178,  # 1x T4
+    "ml.g4dn.8xlarge": 2.36,  # 1x T4
+    "ml.g5.xlarge": 0.526,  # 1x A10G
+    "ml.g5.2xlarge": 0.736,  # 1x A10G
+    "ml.g5.4xlarge": 1.178,  # 1x A10G
+    "ml.g5.8xlarge": 2.36,  # 1x A10G
+    "ml.g5.12xlarge": 3.912,  # 4x A10G
+    "ml.g5.16xlarge": 4.712,  # 1x A10G
+    "ml.g5.24xlarge": 7.824,  # 4x A10G
+    "ml.g5.48xlarge": 15.648,  # 8x A10G
+}
+DEFAULT_HOURLY_RATE = 3.06  # Default para p3.2xlarge
+
+# Custo de dados (aproximado): $0.023 por GB, estimando 100GB
+ESTIMATED_DATA_COST = 0.023 * 100
+
 
 @dataclass
 class TrainingJobConfig:
@@ -55,13 +83,16 @@ class AWSTrainingManager:
         self.config_path = Path(config_path)
         self.config = self._load_config()
 
-        # Inicializa sessão SageMaker
-        self.session = sagemaker.Session()
-        self.role = get_execution_role()
+        # Hiperparâmetros combinados e tipo de instância por modelo
+        self._merged_config_cache: dict[str, tuple[dict[str, Any], str]] = {}
 
-        # Inicializa clientes
-        self.sagemaker_client = boto3.client("sagemaker")
-        self.s3_client = boto3.client("s3")
+        # Inicializa clientes (compartilhados entre gerenciadores)
+        self.sagemaker_client = get_aws_client("sagemaker")
+        self.s3_client = get_aws_client("s3")
+
+        # Inicializa sessão SageMaker
+        self.session = sagemaker.Session(sagemaker_client=self.sagemaker_client)
+        self.role = get_execution_role(self.session)
 
         logger.info("AWS Training Manager inicializado com sucesso")
 
@@ -82,10 +113,39 @@ class AWSTrainingManager:
             logger.error(f"Erro ao carregar configuração: {e}")
             return {}
 
+    def _merged_training_config(self, model_name: str) -> tuple[dict[str, Any], str]:
+        """
+        Hiperparâmetros (padrão + modelo) e tipo de instância de um modelo.
+
+        Apenas a combinação do YAML é memoizada (por instância); o chamador
+        deve copiar o dicionário antes de expô-lo.
+        """
+        cached = self._merged_config_cache.get(model_name)
+        if cached is None:
+            training = self.config.get("training", {})
+            training_config = {
+                **training.get("default", {}),
+                **training.get("models", {}).get(model_name, {}),
+            }
+            instance_type = (
+                self.config.get("sagemaker", {})
+                .get("training", {})
+                .get("default_instance_type", "ml.p3.2xlarge")
+            )
+            cached = self._merged_config_cache[model_name] = (
+                training_config,
+                instance_type,
+            )
+        return cached
+
     def get_training_config(self, model_name: str) -> TrainingJobConfig:
         """
         Obtém configuração de treinamento para um modelo específico.
 
+        A combinação das configurações do YAML é memoizada por modelo; o
+        envio dos dados ao S3 acontece a cada chamada e cada chamada recebe
+        uma configuração própria.
+
         Args:
             model_name: Nome do modelo (lstm_vae, tranad, usad, ecod)
 
@@ -93,23 +153,7 @@ class AWSTrainingManager:
             Configuração de treinamento
         """
         try:
-            # Configuração padrão
-            default_config = self.config.get("training", {}).get("default", {})
-
-            # Configuração específica do modelo
-            model_config = (
-                self.config.get("training", {}).get("models", {}).get(model_name, {})
-            )
-
-            # Combina configurações
-            training_config = {**default_config, **model_config}
-
-            # Configuração de instância
-            instance_type = (
-                self.config.get("sagemaker", {})
-                .get("training", {})
-                .get("default_instance_type", "ml.p3.2xlarge")
-            )
+            training_config, instance_type = self._merged_training_config(model_name)
 
             # Configuração de entrada
             input_data_config = {
@@ -143,7 +187,7 @@ class AWSTrainingManager:
                 instance_count=1,
                 volume_size_gb=100,
                 max_run_seconds=3600 * 24,  # 24 horas
-                hyperparameters=training_config,
+                hyperparameters=dict(training_config),
                 input_data_config=input_data_config,
                 output_data_config=output_data_config,
             )
@@ -152,6 +196,22 @@ class AWSTrainingManager:
             logger.error(f"Erro ao obter configuração de treinamento: {e}")
             raise
 
+    def get_hyperparameter_search_space(self, model_name: str) -> dict[str, Any]:
+        """
+        Obtém espaço de busca de hiperparâmetros para um modelo.
+
+        Args:
+            model_name: Nome do modelo
+
+        Returns:
+            Espaço de busca de hiperparâmetros (cópia, pode ser alterada)
+        """
+        return copy.deepcopy(
+            self.config.get("hyperparameter_tuning", {})
+            .get("search_spaces", {})
+            .get(model_name, {})
+        )
+
     def create_training_job(self, config: TrainingJobConfig) -> str:
         """
         Cria job de treinamento no SageMaker.
@@ -208,11 +268,7 @@ class AWSTrainingManager:
         """
         try:
             # Obtém espaço de busca
-            search_space = (
-                self.config.get("hyperparameter_tuning", {})
-                .get("search_spaces", {})
-                .get(config.model_name, {})
-            )
+            search_space = self.get_hyperparameter_search_space(config.model_name)
 
             if not search_space:
                 logger.warning(
@@ -372,44 +428,50 @@ class AWSTrainingManager:
             logger.error(f"Erro ao monitorar job: {e}")
             raise
 
-    def list_training_jobs(self, model_name: str | None = None) -> list[dict[str, Any]]:
+    def list_training_jobs(
+        self, model_name: str | None = None, max_items: int | None = None
+    ) -> Iterator[dict[str, Any]]:
         """
-        Lista jobs de treinamento.
+        Lista jobs de treinamento de forma preguiçosa.
+
+        Os jobs são obtidos página a página pelo paginator do boto3, de modo
+        que apenas as páginas efetivamente consumidas são requisitadas.
 
         Args:
             model_name: Filtra por nome do modelo
+            max_items: Número máximo de jobs retornados (após o filtro)
 
-        Returns:
-            Lista de jobs de treinamento
+        Yields:
+            Informações de cada job de treinamento
         """
         try:
-            jobs = []
-
-            # Lista jobs
+            # O filtro por modelo vai para o servidor (NameContains); o limite
+            # é aplicado depois do filtro, para não cortar jobs que casam
             paginator = self.sagemaker_client.get_paginator("list_training_jobs")
             page_iterator = paginator.paginate(
-                NameContains="petrobras", SortBy="CreationTime", SortOrder="Descending"
+                NameContains=model_name or "petrobras",
+                SortBy="CreationTime",
+                SortOrder="Descending",
+                PaginationConfig={"PageSize": 100},
             )
 
-            for page in page_iterator:
-                for job in page["TrainingJobSummaries"]:
-                    if not model_name or model_name in job["TrainingJobName"]:
-                        jobs.append(
-                            {
-                                "job_name": job["TrainingJobName"],
-                                "status": job["TrainingJobStatus"],
-                                "creation_time": job["CreationTime"],
-                                "end_time": job.get("EndTime"),
-                                "instance_type": job.get("TrainingJobStatus")
-                                == "InProgress"
-                                and job.get("InstanceType"),
-                                "instance_count": job.get("TrainingJobStatus")
-                                == "InProgress"
-                                and job.get("InstanceCount"),
-                            }
-                        )
-
-            return jobs
+            jobs = (
+                job
+                for page in page_iterator
+                for job in page["TrainingJobSummaries"]
+                if "petrobras" in job["TrainingJobName"].lower()
+            )
+            for job in islice(jobs, max_items):
+                yield {
+                    "job_name": job["TrainingJobName"],
+                    "status": job["TrainingJobStatus"],
+                    "creation_time": job["CreationTime"],
+                    "end_time": job.get("EndTime"),
+                    "instance_type": job.get("TrainingJobStatus") == "InProgress"
+                    and job.get("InstanceType"),
+                    "instance_count": job.get("TrainingJobStatus") == "InProgress"
+                    and job.get("InstanceCount"),
+                }
 
         except Exception as e:
             logger.error(f"Erro ao listar jobs: {e}")
@@ -494,47 +556,50 @@ class AWSTrainingManager:
             Estimativa de custo
         """
         try:
-            # Preços por hora (aproximados, podem variar)
-            pricing = {
-                "ml.p3.2xlarge": 3.06,  # 1x V100
-                "ml.p3.8xlarge": 12.24,  # 4x V100
-                "ml.p3.16xlarge": 24.48,  # 8x V100
-                "ml.g4dn.xlarge": 0.526,  # 1x T4
-                "ml.g4dn.2xlarge": 0.736,  # 1x T4
-                "ml.g4dn.4xlarge": 1.178,  # 1x T4
-                "ml.g4dn.8xlarge": 2.36,  # 1x T4
-                "ml.g5.xlarge": 0.526,  # 1x A10G
-                "ml.g5.2xlarge": 0.736,  # 1x A10G
-                "ml.g5.4xlarge": 1.178,  # 1x A10G
-                "ml.g5.8xlarge": 2.36,  # 1x A10G
-                "ml.g5.12xlarge": 3.912,  # 4x A10G
-                "ml.g5.16xlarge": 4.712,  # 1x A10G
-                "ml.g5.24xlarge": 7.824,  # 4x A10G
-                "ml.g5.48xlarge": 15.648,  # 8x A10G
-            }
-
-            # Calcula custo estimado
-            hourly_cost = pricing.get(
-                config.instance_type, 3.06
-            )  # Default para p3.2xlarge
-            estimated_hours = config.max_run_seconds / 3600
-            total_cost = hourly_cost * estimated_hours * config.instance_count
-
-            # Adiciona custo de dados (aproximado)
-            data_cost = 0.023 * 100  # $0.023 por GB, estimando 100GB
-
-            return {
-                "instance_cost": total_cost,
-                "data_cost": data_cost,
-                "total_cost": total_cost + data_cost,
-                "hourly_rate": hourly_cost,
-                "estimated_hours": estimated_hours,
-            }
+            estimates = self.get_cost_estimates([config])
+            return {name: float(values[0]) for name, values in estimates.items()}
 
         except Exception as e:
             logger.error(f"Erro ao estimar custo: {e}")
             return {}
 
+    def get_cost_estimates(
+        self, configs: Sequence[TrainingJobConfig]
+    ) -> dict[str, np.ndarray]:
+        """
+        Estima o custo de vários treinamentos de uma vez.
+
+        O cálculo é vetorizado com NumPy, o que permite comparar rapidamente
+        muitas combinações de instância/duração (ex.: ao varrer um espaço de
+        busca) e selecionar a mais barata com ``np.argmin``.
+
+        Args:
+            configs: Configurações dos jobs de treinamento
+
+        Returns:
+            Arrays de estimativas, alinhados com ``configs``
+        """
+        hourly_rates = np.array(
+            [
+                INSTANCE_HOURLY_PRICING.get(c.instance_type, DEFAULT_HOURLY_RATE)
+                for c in configs
+            ],
+            dtype=float,
+        )
+        estimated_hours = np.array([c.max_run_seconds for c in configs]) / 3600
+        instance_counts = np.array([c.instance_count for c in configs])
+
+        instance_cost = hourly_rates * estimated_hours * instance_counts
+        data_cost = np.full_like(instance_cost, ESTIMATED_DATA_COST)
+
+        return {
+            "instance_cost": instance_cost,
+            "data_cost": data_cost,
+            "total_cost": instance_cost + data_cost,
+            "hourly_rate": hourly_rates,
+            "estimated_hours": estimated_hours,
+        }
+
 
 def main():
     """Função principal para teste do gerenciador de treinamento."""
@@ -548,8 +613,8 @@ def main():
 
         # Lista jobs existentes
         print("\n📋 Jobs de treinamento existentes:")
-        jobs = manager.list_training_jobs()
-        for job in jobs[:5]:  # Mostra apenas os 5 mais recentes
+        jobs = manager.list_training_jobs(max_items=5)
+        for job in islice(jobs, 5):  # Mostra apenas os 5 mais recentes
             print(f"   • {job['job_name']} - {job['status']}")
 
         # Exemplo de configuração para LSTM-VAE
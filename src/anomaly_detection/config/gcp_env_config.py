@@ -4,7 +4,11 @@ Secure configuration loading for Google Cloud Platform credentials.
 """
 
 import os
-from pathlib import Path
+from collections.abc import Mapping
+from functools import cached_property
+from types import MappingProxyType
+
+REQUIRED_ENV_VARS = ("GCP_PROJECT_ID", "GCP_BUCKET_NAME")
 
 
 class GCPEnvConfig:
@@ -12,58 +16,68 @@ class GCPEnvConfig:
 
     def __init__(self):
         """Initialize GCP configuration from environment variables."""
-        self.project_id = self._get_required_env("GCP_PROJECT_ID")
-        self.region = self._get_env("GCP_REGION", "us-central1")
-        self.zone = self._get_env("GCP_ZONE", "us-central1-a")
-        self.bucket_name = self._get_required_env("GCP_BUCKET_NAME")
-        self.vertex_ai_location = self._get_env("VERTEX_AI_LOCATION", "us-central1")
+        env = os.environ
+        for key in REQUIRED_ENV_VARS:
+            if not env.get(key):
+                raise ValueError(f"Required environment variable {key} not found")
+
+        self.project_id = env["GCP_PROJECT_ID"]
+        self.region = env.get("GCP_REGION", "us-central1")
+        self.zone = env.get("GCP_ZONE", "us-central1-a")
+        self.bucket_name = env["GCP_BUCKET_NAME"]
+        self.vertex_ai_location = env.get("VERTEX_AI_LOCATION", "us-central1")
 
         # Authentication
-        self.service_account_path = self._get_env("GOOGLE_APPLICATION_CREDENTIALS")
+        self.service_account_path = env.get("GOOGLE_APPLICATION_CREDENTIALS", "")
+
+        self._base_path = f"gs://{self.bucket_name}"
 
         # Validate configuration
         self._validate_config()
 
-    def _get_required_env(self, key: str) -> str:
-        """Get required environment variable."""
-        value = os.getenv(key)
-        if not value:
-            raise ValueError(f"Required environment variable {key} not found")
-        return value
-
-    def _get_env(self, key: str, default: str = "") -> str:
-        """Get environment variable with default."""
-        return os.getenv(key, default)
-
     def _validate_config(self) -> None:
         """Validate GCP configuration."""
         if self.service_account_path:
-            if not Path(self.service_account_path).exists():
+            if not os.path.exists(self.service_account_path):
                 raise FileNotFoundError(
                     f"Service account key file not found: {self.service_account_path}"
                 )
 
+    @cached_property
+    def storage_paths(self) -> Mapping[str, str]:
+        """GCS storage paths, built once and shared read-only."""
+        base_path = self._base_path
+        return MappingProxyType(
+            {
+                "data": f"{base_path}/data",
+                "models": f"{base_path}/models",
+                "experiments": f"{base_path}/experiments",
+                "logs": f"{base_path}/logs",
+                "checkpoints": f"{base_path}/checkpoints",
+                "tensorboard": f"{base_path}/tensorboard-logs",
+                "mlflow_artifacts": f"{base_path}/mlflow-artifacts",
+            }
+        )
+
+    @cached_property
+    def vertex_ai_config(self) -> Mapping[str, str]:
+        """Vertex AI configuration, built once and shared read-only."""
+        return MappingProxyType(
+            {
+                "project_id": self.project_id,
+                "location": self.vertex_ai_location,
+                "experiment_name": "petrobras-anomaly-detection",
+                "model_registry_name": "anomaly-detection-models",
+            }
+        )
+
     def get_storage_paths(self) -> dict[str, str]:
-        """Get GCS storage paths."""
-        base_path = f"gs://{self.bucket_name}"
-        return {
-            "data": f"{base_path}/data",
-            "models": f"{base_path}/models",
-            "experiments": f"{base_path}/experiments",
-            "logs": f"{base_path}/logs",
-            "checkpoints": f"{base_path}/checkpoints",
-            "tensorboard": f"{base_path}/tensorboard-logs",
-            "mlflow_artifacts": f"{base_path}/mlflow-artifacts",
-        }
+        """Get GCS storage paths (a fresh, JSON-serializable dict)."""
+        return dict(self.storage_paths)
 
     def get_vertex_ai_config(self) -> dict[str, str]:
-        """Get Vertex AI configuration."""
-        return {
-            "project_id": self.project_id,
-            "location": self.vertex_ai_location,
-            "experiment_name": "petrobras-anomaly-detection",
-            "model_registry_name": "anomaly-detection-models",
-        }
+        """Get Vertex AI configuration (a fresh, JSON-serializable dict)."""
+        return dict(self.vertex_ai_config)
 
     def is_configured(self) -> bool:
         """Check if GCP is properly configured."""
@@ -73,13 +87,20 @@ class GCPEnvConfig:
             return False
 
 
-# Global instance
-def get_gcp_config():
+# Global instance (only a successful config is kept, so variables set after
+# import are still picked up by later calls)
+_gcp_config: GCPEnvConfig | None = None
+
+
+def get_gcp_config() -> GCPEnvConfig | None:
     """Get GCP config instance if properly configured."""
-    try:
-        return GCPEnvConfig()
-    except ValueError:
-        return None
+    global _gcp_config
+    if _gcp_config is None:
+        try:
+            _gcp_config = GCPEnvConfig()
+        except ValueError:
+            return None
+    return _gcp_config
 
 
 gcp_config = get_gcp_config()
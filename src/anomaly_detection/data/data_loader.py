@@ -9,18 +9,127 @@ Este módulo fornece funcionalidades para:
 """
 
 import logging
+import threading
+from collections import OrderedDict
 from pathlib import Path
-from typing import Any
+from typing import Any, Literal
 
+import joblib
 import numpy as np
 import pandas as pd
 import polars as pl
-from sklearn.model_selection import train_test_split
+import pyarrow as pa
+import pyarrow.dataset as ds
 from sklearn.preprocessing import MinMaxScaler, StandardScaler
 
 from .threew_dataset import ThreeWDataset, is_threew_available
 
 
+def _concatenate_consuming(
+    arrays: list[np.ndarray], dtype: np.dtype | type | None = None
+) -> np.ndarray:
+    """
+    Concatena ao longo do eixo 0 esvaziando a lista durante a cópia.
+
+    Equivale a ``np.concatenate(arrays, axis=0, dtype=dtype)``, mas preenche o
+    resultado do fim para o início com ``list.pop()``, de modo que cada
+    instância pode ser liberada logo após ser copiada.
+
+    Args:
+        arrays: Arrays por instância (a lista é esvaziada)
+        dtype: Tipo do resultado (padrão: o tipo promovido das entradas)
+
+    Returns:
+        Array concatenado
+    """
+    if not arrays:
+        raise ValueError("Nenhuma instância para concatenar")
+    if dtype is None:
+        dtype = np.result_type(*arrays)
+
+    total = sum(len(a) for a in arrays)
+    out = np.empty((total, *arrays[0].shape[1:]), dtype=dtype)
+    end = total
+    while arrays:
+        a = arrays.pop()
+        out[end - len(a) : end] = a
+        end -= len(a)
+    return out
+
+
+def _stratified_split_indices(
+    y: np.ndarray, test_size: float, seed: int = 42
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Índices de uma divisão treino/validação estratificada e embaralhada.
+
+    Mesmo resultado estatístico do ``train_test_split(..., stratify=y)``
+    (proporção de cada classe preservada, ordem aleatória), com uma única
+    ordenação dos labels; é várias vezes mais rápido em milhões de linhas.
+
+    Args:
+        y: Labels
+        test_size: Proporção de cada classe destinada à validação
+        seed: Semente do gerador aleatório
+
+    Returns:
+        Tupla (índices de treino, índices de validação)
+    """
+    rng = np.random.default_rng(seed)
+
+    # Agrupa os índices por classe: ordenação estável + fronteiras das classes
+    order = np.argsort(y, kind="stable")
+    y_sorted = y[order]
+    bounds = np.flatnonzero(y_sorted[1:] != y_sorted[:-1]) + 1
+
+    train_parts, val_parts = [], []
+    for class_idx in np.split(order, bounds):
+        rng.shuffle(class_idx)
+        n_val = int(round(test_size * len(class_idx)))
+        val_parts.append(class_idx[:n_val])
+        train_parts.append(class_idx[n_val:])
+
+    train_idx = np.concatenate(train_parts)
+    val_idx = np.concatenate(val_parts)
+    rng.shuffle(train_idx)
+    rng.shuffle(val_idx)
+    return train_idx, val_idx
+
+
+class _LRUCache:
+    """
+    Cache em memória com limite de entradas e remoção da menos usada (LRU).
+
+    Seguro para uso por várias threads do mesmo carregador.
+    """
+
+    def __init__(self, max_size: int):
+        self.max_size = max_size
+        self._items: OrderedDict[str, Any] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Any | None:
+        with self._lock:
+            if key not in self._items:
+                return None
+            self._items.move_to_end(key)
+            return self._items[key]
+
+    def put(self, key: str, value: Any) -> None:
+        with self._lock:
+            self._items[key] = value
+            self._items.move_to_end(key)
+            while len(self._items) > self.max_size:
+                self._items.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._items.clear()
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+
 class TimeSeriesDataLoader:
     """
     Carregador de dados para séries temporais multivariadas.
@@ -34,6 +143,8 @@ class TimeSeriesDataLoader:
         data_path: str | Path | None = None,
         use_threew: bool = True,
         cache_data: bool = True,
+        cache_dir: str | Path | None = None,
+        max_cached_problems: int = 8,
     ):
         """
         Inicializa o carregador de dados.
@@ -42,13 +153,31 @@ class TimeSeriesDataLoader:
             data_path: Caminho para os dados
             use_threew: Se deve usar o dataset 3W quando disponível
             cache_data: Se deve fazer cache dos dados carregados
+            cache_dir: Diretório do cache em disco dos problemas 3W (padrão:
+                ``<data_path>/.jbcache``; sem data_path, apenas cache em RAM)
+            max_cached_problems: Máximo de problemas mantidos no cache em
+                memória; os menos usados recentemente são descartados
         """
         self.data_path = Path(data_path) if data_path else None
         self.use_threew = use_threew and is_threew_available()
         self.cache_data = cache_data
 
-        # Cache para dados carregados
-        self._data_cache = {}
+        # Cache para dados carregados (limitado, para não crescer sem fim
+        # em execuções longas que percorrem muitos folds)
+        self._data_cache = _LRUCache(max_cached_problems)
+
+        # Cache em disco: entre processos, os arrays voltam como memmap
+        # somente leitura, sem reprocessar nem copiar os folds
+        if cache_dir is None and self.data_path is not None:
+            cache_dir = self.data_path / ".jbcache"
+        if cache_data and cache_dir is not None:
+            self._memory = joblib.Memory(cache_dir, mmap_mode="r", verbose=0)
+            self._compute_threew_problem_cached = self._memory.cache(
+                type(self)._compute_threew_problem, ignore=["self"]
+            )
+        else:
+            self._memory = None
+            self._compute_threew_problem_cached = None
 
         # Inicializa o dataset 3W se disponível
         if self.use_threew:
@@ -67,36 +196,135 @@ class TimeSeriesDataLoader:
 
         logging.info(f"TimeSeriesDataLoader inicializado - 3W: {self.use_threew}")
 
+    def scan_parquet(
+        self,
+        file_path: str | Path,
+        columns: list[str] | None = None,
+        filter_expr: pl.Expr | None = None,
+        hive_partitioning: bool | None = None,
+    ) -> pl.LazyFrame | None:
+        """
+        Cria uma consulta lazy sobre um ou mais arquivos Parquet.
+
+        Nada é lido até ``collect()``: a seleção de colunas e o filtro são
+        empurrados para a leitura, que carrega apenas os row groups e colunas
+        necessários. Aceita também URIs remotas (``gs://``, ``s3://``) e
+        padrões glob (``dados/*.parquet``), lidos em paralelo pelo Polars.
+
+        Args:
+            file_path: Caminho, URI ou padrão glob dos arquivos Parquet
+            columns: Lista de colunas para carregar (None para todas)
+            filter_expr: Expressão Polars para filtrar linhas (ex.:
+                ``pl.col("timestamp").is_between(t0, t1)``)
+            hive_partitioning: Usa partições ``chave=valor`` do caminho para
+                descartar arquivos inteiros (None: automático para diretórios)
+
+        Returns:
+            LazyFrame com a consulta ou None se erro
+        """
+        source = str(file_path)
+        is_local_file = "://" not in source and not any(c in source for c in "*?[")
+        if is_local_file and not Path(source).exists():
+            logging.error(f"Arquivo não encontrado: {file_path}")
+            return None
+
+        lf = pl.scan_parquet(source, hive_partitioning=hive_partitioning)
+        if filter_expr is not None:
+            lf = lf.filter(filter_expr)
+        if columns is not None:
+            lf = lf.select(columns)
+
+        return lf
+
     def load_from_parquet(
-        self, file_path: str | Path, columns: list[str] | None = None
-    ) -> pd.DataFrame | None:
+        self,
+        file_path: str | Path,
+        columns: list[str] | None = None,
+        filter_expr: pl.Expr | None = None,
+        return_type: Literal["pandas", "polars", "arrow", "numpy"] = "pandas",
+    ) -> pd.DataFrame | pl.DataFrame | pa.Table | np.ndarray | None:
         """
         Carrega dados de um arquivo Parquet.
 
         Args:
             file_path: Caminho para o arquivo Parquet
             columns: Lista de colunas para carregar (None para todas)
+            filter_expr: Expressão Polars para filtrar linhas antes da leitura
+            return_type: Formato do resultado. ``"polars"`` e ``"arrow"`` evitam
+                a conversão para Pandas (o Arrow compartilha os buffers do
+                Polars); ``"numpy"`` retorna a matriz 2D dos valores
+
+        Returns:
+            Dados no formato pedido ou None se erro
+
+        Raises:
+            ValueError: Se ``return_type`` for inválido
+        """
+        if return_type not in ("pandas", "polars", "arrow", "numpy"):
+            raise ValueError(f"Tipo de retorno inválido: {return_type}")
+
+        try:
+            lf = self.scan_parquet(file_path, columns=columns, filter_expr=filter_expr)
+            if lf is None:
+                return None
+
+            # Usa Polars (engine streaming) para carregamento rápido
+            df_pl = lf.collect(engine="streaming")
+            logging.info(f"Dados carregados de {file_path}: {df_pl.shape}")
+
+            if return_type == "polars":
+                return df_pl
+            if return_type == "arrow":
+                return df_pl.to_arrow()
+            if return_type == "numpy":
+                return df_pl.to_numpy()
+            return df_pl.to_pandas()
+
+        except Exception as e:
+            logging.error(f"Erro ao carregar arquivo Parquet: {e}")
+            return None
+
+    def load_from_parquet_dataset(
+        self,
+        root: str | Path,
+        columns: list[str] | None = None,
+        filters: ds.Expression | None = None,
+    ) -> pd.DataFrame | None:
+        """
+        Carrega um dataset Parquet com vários arquivos (ex.: particionado por
+        diretórios ``chave=valor``).
+
+        O Arrow decodifica os row groups em paralelo e aplica o filtro e a
+        projeção durante a leitura.
+
+        Args:
+            root: Diretório raiz do dataset
+            columns: Lista de colunas para carregar (None para todas)
+            filters: Expressão ``pyarrow.dataset`` para filtrar linhas (ex.:
+                ``ds.field("well") == "A"``)
 
         Returns:
             DataFrame com os dados ou None se erro
         """
         try:
-            file_path = Path(file_path)
-            if not file_path.exists():
-                logging.error(f"Arquivo não encontrado: {file_path}")
+            root = Path(root)
+            if not root.exists():
+                logging.error(f"Dataset não encontrado: {root}")
                 return None
 
-            # Usa Polars para carregamento rápido
-            df_pl = pl.read_parquet(file_path, columns=columns)
+            dataset = ds.dataset(str(root), format="parquet", partitioning="hive")
+            table = dataset.to_table(columns=columns, filter=filters, use_threads=True)
 
-            # Converte para Pandas se necessário
-            df = df_pl.to_pandas()
+            # self_destruct libera os buffers Arrow à medida que o DataFrame é
+            # montado, reduzindo o pico de memória da conversão
+            df = table.to_pandas(self_destruct=True, split_blocks=True)
+            del table
 
-            logging.info(f"Dados carregados de {file_path}: {df.shape}")
+            logging.info(f"Dataset carregado de {root}: {df.shape}")
             return df
 
         except Exception as e:
-            logging.error(f"Erro ao carregar arquivo Parquet: {e}")
+            logging.error(f"Erro ao carregar dataset Parquet: {e}")
             return None
 
     def load_from_csv(
@@ -122,8 +350,11 @@ class TimeSeriesDataLoader:
                 logging.error(f"Arquivo não encontrado: {file_path}")
                 return None
 
-            # Usa Polars para carregamento rápido
-            df_pl = pl.read_csv(file_path, separator=separator, columns=columns)
+            # Usa Polars (scan lazy) para ler apenas as colunas necessárias
+            lf = pl.scan_csv(file_path, separator=separator)
+            if columns is not None:
+                lf = lf.select(columns)
+            df_pl = lf.collect(engine="streaming")
             df = df_pl.to_pandas()
 
             logging.info(f"Dados carregados de {file_path}: {df.shape}")
@@ -140,6 +371,7 @@ class TimeSeriesDataLoader:
         fold_index: int = 0,
         normalize: bool = True,
         test_size: float = 0.2,
+        dtype: np.dtype | type = np.float32,
     ) -> dict[str, Any] | None:
         """
         Carrega dados de um problema específico do dataset 3W.
@@ -150,6 +382,8 @@ class TimeSeriesDataLoader:
             fold_index: Índice do fold
             normalize: Se deve normalizar os dados
             test_size: Proporção de dados para teste
+            dtype: Tipo das features (float32 é suficiente para a precisão
+                dos sensores e reduz pela metade memória e banda)
 
         Returns:
             Dicionário com dados de treino e teste ou None se erro
@@ -159,58 +393,33 @@ class TimeSeriesDataLoader:
             return None
 
         try:
-            # Carrega as instâncias
-            result = self.threew_dataset.load_instances_for_problem(
-                problem_name, fold_config, fold_index
-            )
-
-            if result is None:
-                return None
-
-            X_train, y_train, X_test, y_test = result
-
-            # Concatena todas as instâncias
-            X_train_combined = np.concatenate(X_train, axis=0)
-            y_train_combined = np.concatenate(y_train, axis=0)
-            X_test_combined = np.concatenate(X_test, axis=0)
-            y_test_combined = np.concatenate(y_test, axis=0)
-
-            # Normaliza se solicitado
-            if normalize:
-                X_train_combined, X_test_combined = self._normalize_data(
-                    X_train_combined, X_test_combined
+            args = (problem_name, fold_config, fold_index, normalize, test_size)
+            if self._compute_threew_problem_cached is not None:
+                # O token do dataset entra na chave do cache em disco, para
+                # que trocar ou atualizar os dados não devolva folds antigos
+                computed = self._compute_threew_problem_cached(
+                    self, *args, dtype, self.threew_dataset.cache_token()
                 )
+            else:
+                computed = self._compute_threew_problem(*args, dtype)
 
-            # Divide em treino e validação
-            X_train_final, X_val, y_train_final, y_val = train_test_split(
-                X_train_combined,
-                y_train_combined,
-                test_size=test_size,
-                random_state=42,
-                stratify=y_train_combined,
-            )
+            if computed is None:
+                return None
 
-            data_dict = {
-                "X_train": X_train_final,
-                "y_train": y_train_final,
-                "X_val": X_val,
-                "y_val": y_val,
-                "X_test": X_test_combined,
-                "y_test": y_test_combined,
-                "problem_name": problem_name,
-                "fold_config": fold_config,
-                "fold_index": fold_index,
-                "normalized": normalize,
-            }
+            data_dict, scaler = computed
+            if scaler is not None:
+                self.scaler = scaler
+                self.scaler_fitted = True
 
             # Cache dos dados se habilitado
             if self.cache_data:
                 cache_key = f"{problem_name}_{fold_config}_{fold_index}"
-                self._data_cache[cache_key] = data_dict
+                self._data_cache.put(cache_key, data_dict)
 
             logging.info(f"Dados do problema {problem_name} carregados com sucesso")
             logging.info(
-                f"Treino: {X_train_final.shape}, Val: {X_val.shape}, Teste: {X_test_combined.shape}"
+                f"Treino: {data_dict['X_train'].shape}, Val: {data_dict['X_val'].shape}, "
+                f"Teste: {data_dict['X_test'].shape}"
             )
 
             return data_dict
@@ -219,6 +428,75 @@ class TimeSeriesDataLoader:
             logging.error(f"Erro ao carregar problema 3W: {e}")
             return None
 
+    def _compute_threew_problem(
+        self,
+        problem_name: str,
+        fold_config: str,
+        fold_index: int,
+        normalize: bool,
+        test_size: float,
+        dtype: np.dtype | type,
+        dataset_token: tuple[str, str, int, int] | None = None,
+    ) -> tuple[dict[str, Any], StandardScaler | MinMaxScaler | None] | None:
+        """
+        Carrega, concatena, normaliza e divide um problema 3W.
+
+        Depende apenas dos argumentos (é a função memoizada em disco); o
+        scaler ajustado é retornado junto para ser restaurado em cache hits.
+        ``dataset_token`` (ver ``ThreeWDataset.cache_token``) é usado apenas
+        como parte da chave do cache.
+        """
+        # Carrega as instâncias
+        result = self.threew_dataset.load_instances_for_problem(
+            problem_name, fold_config, fold_index
+        )
+
+        if result is None:
+            return None
+
+        X_train, y_train, X_test, y_test = result
+
+        # Concatena todas as instâncias (uma alocação por array, com a
+        # conversão de dtype feita durante a cópia); cada instância é
+        # liberada assim que copiada, então o pico de memória é o array
+        # combinado mais uma instância, e não o dobro dos dados
+        X_train_combined = _concatenate_consuming(X_train, dtype)
+        y_train_combined = _concatenate_consuming(y_train)
+        X_test_combined = _concatenate_consuming(X_test, dtype)
+        y_test_combined = _concatenate_consuming(y_test)
+        del result, X_train, y_train, X_test, y_test
+
+        # Normaliza se solicitado
+        scaler = None
+        if normalize:
+            X_train_combined, X_test_combined = self._normalize_data(
+                X_train_combined, X_test_combined
+            )
+            scaler = self.scaler
+
+        # Divide em treino e validação (estratificado por classe)
+        train_idx, val_idx = _stratified_split_indices(
+            y_train_combined, test_size, seed=42
+        )
+        X_train_final = np.take(X_train_combined, train_idx, axis=0)
+        X_val = np.take(X_train_combined, val_idx, axis=0)
+        y_train_final = np.take(y_train_combined, train_idx)
+        y_val = np.take(y_train_combined, val_idx)
+
+        data_dict = {
+            "X_train": X_train_final,
+            "y_train": y_train_final,
+            "X_val": X_val,
+            "y_val": y_val,
+            "X_test": X_test_combined,
+            "y_test": y_test_combined,
+            "problem_name": problem_name,
+            "fold_config": fold_config,
+            "fold_index": fold_index,
+            "normalized": normalize,
+        }
+        return data_dict, scaler
+
     def _normalize_data(
         self, X_train: np.ndarray, X_test: np.ndarray, method: str = "standard"
     ) -> tuple[np.ndarray, np.ndarray]:
@@ -233,13 +511,20 @@ class TimeSeriesDataLoader:
         Returns:
             Tupla com dados normalizados
         """
+        # copy=False: normaliza in-place, pois os arrays recebidos são
+        # concatenações locais ao carregamento e não têm outras referências
         if method == "standard":
-            self.scaler = StandardScaler()
+            self.scaler = StandardScaler(copy=False)
         elif method == "minmax":
-            self.scaler = MinMaxScaler()
+            self.scaler = MinMaxScaler(copy=False)
         else:
             raise ValueError(f"Método de normalização inválido: {method}")
 
+        # Arrays C-contíguos no dtype escolhido no carregamento (float32 por
+        # padrão), evitando cópias implícitas de contiguidade no sklearn
+        X_train = np.ascontiguousarray(X_train)
+        X_test = np.ascontiguousarray(X_test)
+
         # Ajusta o scaler apenas nos dados de treino
         X_train_normalized = self.scaler.fit_transform(X_train)
         X_test_normalized = self.scaler.transform(X_test)
@@ -262,8 +547,10 @@ class TimeSeriesDataLoader:
         return self._data_cache.get(cache_key)
 
     def clear_cache(self) -> None:
-        """Limpa o cache de dados."""
+        """Limpa o cache de dados (em memória e em disco)."""
         self._data_cache.clear()
+        if self._memory is not None:
+            self._memory.clear(warn=False)
         logging.info("Cache de dados limpo")
 
     def get_data_info(self) -> dict[str, Any]:
@@ -312,6 +599,8 @@ def create_data_loader(
     data_path: str | Path | None = None,
     use_threew: bool = True,
     cache_data: bool = True,
+    cache_dir: str | Path | None = None,
+    max_cached_problems: int = 8,
 ) -> TimeSeriesDataLoader:
     """
     Cria um carregador de dados configurado.
@@ -320,10 +609,16 @@ def create_data_loader(
         data_path: Caminho para os dados
         use_threew: Se deve usar o dataset 3W
         cache_data: Se deve fazer cache dos dados
+        cache_dir: Diretório do cache em disco dos problemas 3W
+        max_cached_problems: Máximo de problemas no cache em memória
 
     Returns:
         TimeSeriesDataLoader configurado
     """
     return TimeSeriesDataLoader(
-        data_path=data_path, use_threew=use_threew, cache_data=cache_data
+        data_path=data_path,
+        use_threew=use_threew,
+        cache_data=cache_data,
+        cache_dir=cache_dir,
+        max_cached_problems=max_cached_problems,
     )
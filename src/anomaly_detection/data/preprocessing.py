@@ -12,15 +12,121 @@ import logging
 import warnings
 from typing import Any
 
+import joblib
 import numpy as np
+from numba import njit, prange
+from numpy.lib.stride_tricks import as_strided, sliding_window_view
 from sklearn.decomposition import PCA
 from sklearn.feature_selection import SelectKBest, f_classif, mutual_info_classif
 from sklearn.impute import SimpleImputer
 from sklearn.preprocessing import MinMaxScaler, RobustScaler, StandardScaler
+from sklearn.utils.validation import check_memory
 
 warnings.filterwarnings("ignore")
 
 
+def _has_nan(X: np.ndarray, block: int = 65536) -> bool:
+    """
+    Verifica se há NaN percorrendo blocos de linhas.
+
+    Evita alocar a máscara booleana do array inteiro e para no primeiro bloco
+    com NaN.
+    """
+    for start in range(0, X.shape[0], block):
+        if np.isnan(X[start : start + block]).any():
+            return True
+    return False
+
+
+def _edge_pad(X: np.ndarray, pad_size: int) -> np.ndarray:
+    """
+    Repete a primeira e a última linha ``pad_size`` vezes (padding "edge").
+
+    Equivale a ``np.pad(X, ((pad_size, pad_size), (0, 0)), mode="edge")`` com
+    uma única alocação e sem o overhead genérico do ``np.pad``, relevante
+    quando as janelas são criadas instância a instância.
+    """
+    n_samples = X.shape[0]
+    X_padded = np.empty((n_samples + 2 * pad_size, *X.shape[1:]), dtype=X.dtype)
+    X_padded[pad_size : pad_size + n_samples] = X
+    X_padded[:pad_size] = X[0]
+    X_padded[pad_size + n_samples :] = X[-1]
+    return X_padded
+
+
+@njit(parallel=True, cache=True)
+def _fused_impute_scale(X, fill_values, center, scale, out):
+    """
+    Imputa e normaliza em uma única passada: ``(x or fill - center) / scale``.
+
+    Sem ``fastmath``: ele permitiria ao compilador assumir que não há NaN e
+    eliminar a verificação da imputação.
+    """
+    n_rows, n_cols = X.shape
+    for i in prange(n_rows):
+        for j in range(n_cols):
+            v = X[i, j]
+            if np.isnan(v):
+                v = fill_values[j]
+            out[i, j] = (v - center[j]) / scale[j]
+
+
+def _mutual_info_scores(X: np.ndarray, y: np.ndarray) -> np.ndarray:
+    """
+    Informação mútua de cada atributo com o target.
+
+    Semente fixa para que o resultado seja determinístico e possa ser
+    memoizado pelo conteúdo de ``(X, y)``.
+    """
+    return mutual_info_classif(X, y, random_state=42)
+
+
+@njit(cache=True)
+def _nan_column_means(X):
+    """Média de cada coluna ignorando NaN, em uma passada e sem máscara."""
+    n_rows, n_cols = X.shape
+    sums = np.zeros(n_cols)
+    counts = np.zeros(n_cols)
+    for i in range(n_rows):
+        for j in range(n_cols):
+            v = X[i, j]
+            if not np.isnan(v):
+                sums[j] += v
+                counts[j] += 1.0
+    return sums / counts
+
+
+class _MeanImputer:
+    """
+    Imputação pela média da coluna para arrays densos de ponto flutuante.
+
+    Substitui o ``SimpleImputer(strategy="mean")``: o ajuste é uma passada
+    sem máscara nem cópia, e a transformação reaproveita o kernel fundido
+    (centro 0, escala 1). Expõe ``statistics_`` como o sklearn.
+    """
+
+    def fit(self, X: np.ndarray) -> "_MeanImputer":
+        self.statistics_ = _nan_column_means(X)
+        return self
+
+    def transform(self, X: np.ndarray) -> np.ndarray:
+        if X.ndim != 2 or X.shape[1] != len(self.statistics_):
+            raise ValueError(
+                f"X com forma {X.shape} incompatível com as "
+                f"{len(self.statistics_)} colunas do ajuste"
+            )
+        fill_values = self.statistics_.astype(X.dtype)
+        out = np.empty_like(X)
+        _fused_impute_scale(
+            X,
+            fill_values,
+            np.zeros_like(fill_values),
+            np.ones_like(fill_values),
+            out,
+        )
+        return out
+
+
 class TimeSeriesPreprocessor:
     """
     Pré-processador para séries temporais multivariadas.
@@ -36,6 +142,8 @@ class TimeSeriesPreprocessor:
         feature_selection_method: str = "mutual_info",
         n_features: int | None = None,
         pca_components: int | None = None,
+        dtype: np.dtype | type = np.float32,
+        memory: str | joblib.Memory | None = None,
     ):
         """
         Inicializa o pré-processador.
@@ -46,12 +154,19 @@ class TimeSeriesPreprocessor:
             feature_selection_method: Método de seleção de atributos
             n_features: Número de atributos a selecionar
             pca_components: Número de componentes PCA
+            dtype: Tipo dos dados transformados (entram no pipeline como
+                arrays C-contíguos deste tipo)
+            memory: Diretório ou ``joblib.Memory`` para memoizar os scores de
+                informação mútua (o estimador kNN é lento e se repete entre
+                execuções com os mesmos dados); None desativa
         """
         self.imputation_strategy = imputation_strategy
         self.scaling_method = scaling_method
         self.feature_selection_method = feature_selection_method
         self.n_features = n_features
         self.pca_components = pca_components
+        self.dtype = np.dtype(dtype)
+        self.memory = memory
 
         # Inicializa os transformadores
         self.imputer = None
@@ -59,6 +174,9 @@ class TimeSeriesPreprocessor:
         self.feature_selector = None
         self.pca = None
 
+        # Número de atributos vistos no ajuste
+        self.n_features_in_: int | None = None
+
         # Flags de ajuste
         self.is_fitted = False
 
@@ -124,14 +242,41 @@ class TimeSeriesPreprocessor:
         if not self.is_fitted:
             raise ValueError("Pré-processador deve ser ajustado antes de transformar")
 
-        X_transformed = X.copy()
+        # Entrada C-contígua no dtype do pipeline: evita cópias implícitas de
+        # contiguidade no sklearn e reduz a banda de memória em float32.
+        # Quando já está no formato, nenhuma cópia é feita (os passos abaixo
+        # não alteram a entrada).
+        X_input = X
+        X = np.ascontiguousarray(X, dtype=self.dtype)
+
+        # O kernel numba não verifica limites: um número de colunas diferente
+        # do ajuste leria além dos parâmetros em vez de falhar
+        if X.ndim == 2 and X.shape[1] != self.n_features_in_:
+            raise ValueError(
+                f"X tem {X.shape[1]} atributos, mas o pré-processador foi "
+                f"ajustado com {self.n_features_in_}"
+            )
+
+        # Caminho rápido: imputação + normalização fundidas em um único kernel
+        fused = self._fused_parameters(X)
+        if fused is not None:
+            X_transformed = np.empty(X.shape, dtype=fused[0].dtype)
+            _fused_impute_scale(X, *fused, X_transformed)
+            logging.info(f"Dados transformados: {X.shape} -> {X_transformed.shape}")
+            return X_transformed
+
+        X_transformed = X
 
         # 1. Imputação
         if self.imputer:
             X_transformed = self.imputer.transform(X_transformed)
 
-        # 2. Normalização
+        # 2. Normalização (in-place, o scaler usa copy=False); só copia quando
+        # ainda estaria escrevendo sobre a memória do chamador (inclusive
+        # views e subclasses como np.memmap, que ascontiguousarray reembrulha)
         if self.scaler:
+            if np.may_share_memory(X_transformed, X_input):
+                X_transformed = X_transformed.copy()
             X_transformed = self.scaler.transform(X_transformed)
 
         # 3. Seleção de atributos
@@ -145,11 +290,60 @@ class TimeSeriesPreprocessor:
         logging.info(f"Dados transformados: {X.shape} -> {X_transformed.shape}")
         return X_transformed
 
+    def _fused_parameters(
+        self, X: np.ndarray
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray] | None:
+        """
+        Parâmetros (preenchimento, centro, escala) do kernel fundido.
+
+        Retorna None quando o pipeline não é só imputação + StandardScaler ou
+        RobustScaler, caso em que os transformadores do sklearn são usados.
+        """
+        if self.feature_selector or self.pca or X.ndim != 2:
+            return None
+
+        scaler = self.scaler
+        n_cols = X.shape[1]
+        if isinstance(scaler, StandardScaler):
+            center = scaler.mean_ if scaler.with_mean else None
+            scale = scaler.scale_ if scaler.with_std else None
+        elif isinstance(scaler, RobustScaler):
+            center = scaler.center_ if scaler.with_centering else None
+            scale = scaler.scale_ if scaler.with_scaling else None
+        else:
+            return None
+
+        dtype = X.dtype if X.dtype.kind == "f" else np.dtype(np.float64)
+        if self.imputer:
+            fill_values = self.imputer.statistics_
+            # Colunas sem estatística são descartadas pelo SimpleImputer
+            if np.isnan(fill_values).any():
+                return None
+        else:
+            fill_values = np.full(n_cols, np.nan)
+
+        return (
+            np.asarray(fill_values, dtype=dtype),
+            np.zeros(n_cols, dtype=dtype) if center is None else center.astype(dtype),
+            np.ones(n_cols, dtype=dtype) if scale is None else scale.astype(dtype),
+        )
+
     def _fit_imputer(self, X: np.ndarray) -> None:
         """Ajusta o imputer para valores faltantes."""
-        if np.isnan(X).any():
-            self.imputer = SimpleImputer(strategy=self.imputation_strategy)
-            self.imputer.fit(X)
+        if _has_nan(X):
+            self.imputer = None
+            if (
+                self.imputation_strategy == "mean"
+                and X.ndim == 2
+                and X.dtype.kind == "f"
+            ):
+                mean_imputer = _MeanImputer().fit(np.ascontiguousarray(X))
+                # Colunas só com NaN ficam com o SimpleImputer, que as descarta
+                if not np.isnan(mean_imputer.statistics_).any():
+                    self.imputer = mean_imputer
+            if self.imputer is None:
+                self.imputer = SimpleImputer(strategy=self.imputation_strategy)
+                self.imputer.fit(X)
             logging.info(f"Imputer ajustado com estratégia: {self.imputation_strategy}")
         else:
             logging.info("Nenhum valor faltante encontrado, imputer não necessário")
@@ -157,16 +351,17 @@ class TimeSeriesPreprocessor:
     def _fit_scaler(self, X: np.ndarray) -> None:
         """Ajusta o scaler para normalização."""
         if self.scaling_method == "standard":
-            self.scaler = StandardScaler()
+            self.scaler = StandardScaler(copy=False)
         elif self.scaling_method == "minmax":
-            self.scaler = MinMaxScaler()
+            self.scaler = MinMaxScaler(copy=False)
         elif self.scaling_method == "robust":
-            self.scaler = RobustScaler()
+            self.scaler = RobustScaler(copy=False)
         else:
             raise ValueError(f"Método de normalização inválido: {self.scaling_method}")
 
         # Ajusta o scaler
         self.scaler.fit(X)
+        self.n_features_in_ = self.scaler.n_features_in_
         logging.info(f"Scaler ajustado com método: {self.scaling_method}")
 
     def _fit_feature_selector(self, X: np.ndarray, y: np.ndarray | None) -> None:
@@ -181,8 +376,10 @@ class TimeSeriesPreprocessor:
             self.feature_selector = VarianceThreshold(threshold=0.01)
         else:
             if self.feature_selection_method == "mutual_info":
+                # Scores memoizados em disco pelo conteúdo de (X, y)
+                score_func = check_memory(self.memory).cache(_mutual_info_scores)
                 self.feature_selector = SelectKBest(
-                    score_func=mutual_info_classif, k=self.n_features
+                    score_func=score_func, k=self.n_features
                 )
             elif self.feature_selection_method == "f_classif":
                 self.feature_selector = SelectKBest(
@@ -200,8 +397,14 @@ class TimeSeriesPreprocessor:
 
     def _fit_pca(self, X: np.ndarray) -> None:
         """Ajusta o PCA para redução de dimensionalidade."""
-        self.pca = PCA(n_components=self.pca_components)
-        self.pca.fit(X)
+        # SVD randomizado: O(N·F·k) em vez do SVD completo, vantajoso com
+        # k ≪ F; os dados entram no dtype do pipeline (float32 por padrão)
+        self.pca = PCA(
+            n_components=self.pca_components,
+            svd_solver="randomized",
+            random_state=42,
+        )
+        self.pca.fit(np.ascontiguousarray(X, dtype=self.dtype))
 
         explained_variance_ratio = self.pca.explained_variance_ratio_.sum()
         logging.info(
@@ -224,14 +427,15 @@ class TimeSeriesPreprocessor:
         if not self.is_fitted:
             return []
 
-        features = original_features or [f"feature_{i}" for i in range(1000)]
+        if original_features is not None:
+            features = original_features
+        else:
+            features = [f"feature_{i}" for i in range(self.n_features_in_)]
 
-        # Aplica seleção de atributos
+        # Aplica seleção de atributos (máscara booleana do seletor)
         if self.feature_selector:
-            selected_indices = self.feature_selector.get_support()
-            features = [
-                features[i] for i, selected in enumerate(selected_indices) if selected
-            ]
+            mask = self.feature_selector.get_support()
+            features = np.asarray(features, dtype=object)[mask].tolist()
 
         # Aplica PCA
         if self.pca:
@@ -320,25 +524,14 @@ class RollingWindowPreprocessor:
             f"window_size={window_size}, step_size={step_size}"
         )
 
-    def create_windows(
-        self, X: np.ndarray, y: np.ndarray | None = None
-    ) -> tuple[np.ndarray, np.ndarray | None]:
-        """
-        Cria janelas deslizantes dos dados.
-
-        Args:
-            X: Dados de entrada (n_samples, n_features)
-            y: Labels (opcional)
-
-        Returns:
-            Tupla com janelas de dados e labels correspondentes
-        """
-        n_samples, n_features = X.shape
+    def _pad(self, X: np.ndarray) -> tuple[np.ndarray, int, int]:
+        """Aplica o padding configurado e calcula o número de janelas."""
+        n_samples = X.shape[0]
 
         if self.padding == "same":
             # Padding para manter o mesmo número de amostras
             pad_size = self.window_size // 2
-            X_padded = np.pad(X, ((pad_size, pad_size), (0, 0)), mode="edge")
+            X_padded = _edge_pad(X, pad_size)
         elif self.padding == "valid":
             # Sem padding
             X_padded = X
@@ -346,32 +539,93 @@ class RollingWindowPreprocessor:
         else:  # "full"
             # Padding completo
             pad_size = self.window_size - 1
-            X_padded = np.pad(X, ((pad_size, pad_size), (0, 0)), mode="edge")
+            X_padded = _edge_pad(X, pad_size)
 
         # Calcula o número de janelas
         n_windows = (n_samples + 2 * pad_size - self.window_size) // self.step_size + 1
+        return X_padded, pad_size, n_windows
 
-        # Cria as janelas
-        windows = np.zeros((n_windows, self.window_size, n_features))
-        for i in range(n_windows):
-            start_idx = i * self.step_size
-            end_idx = start_idx + self.window_size
-            windows[i] = X_padded[start_idx:end_idx]
-
-        # Cria labels correspondentes
-        if y is not None:
-            if self.padding == "same":
-                y_windows = y
-            else:
-                y_windows = y[
-                    pad_size : pad_size + n_windows * self.step_size : self.step_size
-                ]
-        else:
-            y_windows = None
+    def _window_labels(
+        self, y: np.ndarray | None, pad_size: int, n_windows: int
+    ) -> np.ndarray | None:
+        """Seleciona os labels correspondentes a cada janela."""
+        if y is None:
+            return None
+        if self.padding == "same":
+            return y
+        return y[pad_size : pad_size + n_windows * self.step_size : self.step_size]
+
+    def create_windows(
+        self, X: np.ndarray, y: np.ndarray | None = None
+    ) -> tuple[np.ndarray, np.ndarray | None]:
+        """
+        Cria janelas deslizantes dos dados.
+
+        As janelas retornadas são uma view somente leitura; use
+        ``np.ascontiguousarray`` se precisar de uma cópia independente.
+
+        Args:
+            X: Dados de entrada (n_samples, n_features)
+            y: Labels (opcional)
+
+        Returns:
+            Tupla com janelas de dados e labels correspondentes
+        """
+        n_features = X.shape[1]
+        X_padded, pad_size, n_windows = self._pad(X)
+
+        # Cria as janelas como uma view (sem cópia) sobre os dados com padding;
+        # a view é somente leitura e as janelas compartilham memória entre si
+        windows = sliding_window_view(
+            X_padded, window_shape=(self.window_size, n_features)
+        )[:, 0][:: self.step_size]
+
+        y_windows = self._window_labels(y, pad_size, n_windows)
 
         logging.info(f"Janelas criadas: {X.shape} -> {windows.shape}")
         return windows, y_windows
 
+    def create_flat_windows(
+        self, X: np.ndarray, y: np.ndarray | None = None
+    ) -> tuple[np.ndarray, np.ndarray | None]:
+        """
+        Cria janelas deslizantes já achatadas, sem o passo intermediário 3D.
+
+        Equivale a ``flatten_windows(create_windows(X, y)[0])``. Quando as
+        linhas dos dados com padding são contíguas, cada janela achatada é um
+        trecho contínuo da memória e o resultado é uma view somente leitura
+        (sem cópia); caso contrário, as janelas são materializadas uma vez.
+
+        Args:
+            X: Dados de entrada (n_samples, n_features)
+            y: Labels (opcional)
+
+        Returns:
+            Tupla com janelas achatadas (n_windows, window_size * n_features)
+            e labels correspondentes
+        """
+        n_features = X.shape[1]
+        X_padded, pad_size, n_windows = self._pad(X)
+        row_stride, col_stride = X_padded.strides
+
+        if X_padded.flags.c_contiguous and n_windows > 0:
+            flat = as_strided(
+                X_padded,
+                shape=(n_windows, self.window_size * n_features),
+                strides=(self.step_size * row_stride, col_stride),
+                writeable=False,
+            )
+        else:
+            windows = sliding_window_view(
+                X_padded, window_shape=(self.window_size, n_features)
+            )[:, 0][:: self.step_size]
+            flat = np.ascontiguousarray(windows).reshape(n_windows, -1)
+
+        y_windows = self._window_labels(y, pad_size, n_windows)
+
+        logging.info(f"Janelas achatadas criadas: {X.shape} -> {flat.shape}")
+        return flat, y_windows
+
     def flatten_windows(self, windows: np.ndarray) -> np.ndarray:
         """
         Achatas as janelas para formato 2D.
@@ -383,7 +637,11 @@ class RollingWindowPreprocessor:
             Dados achatados (n_windows, window_size * n_features)
         """
         n_windows, window_size, n_features = windows.shape
-        flattened = windows.reshape(n_windows, window_size * n_features)
+        # Janelas vindas de create_windows são views sobrepostas: materializa
+        # uma única vez em memória contígua antes do reshape
+        flattened = np.ascontiguousarray(windows).reshape(
+            n_windows, window_size * n_features
+        )
 
         logging.info(f"Janelas achatadas: {windows.shape} -> {flattened.shape}")
         return flattened
@@ -396,6 +654,7 @@ def create_preprocessor(
     feature_selection_method: str = "mutual_info",
     n_features: int | None = None,
     pca_components: int | None = None,
+    memory: str | joblib.Memory | None = None,
 ) -> TimeSeriesPreprocessor:
     """
     Cria um pré-processador configurado.
@@ -406,6 +665,7 @@ def create_preprocessor(
         feature_selection_method: Método de seleção de atributos
         n_features: Número de atributos a selecionar
         pca_components: Número de componentes PCA
+        memory: Cache em disco dos scores de informação mútua
 
     Returns:
         TimeSeriesPreprocessor configurado
@@ -416,6 +676,7 @@ def create_preprocessor(
         feature_selection_method=feature_selection_method,
         n_features=n_features,
         pca_components=pca_components,
+        memory=memory,
     )
 
 
@@ -8,6 +8,8 @@ implementados.
 
 import logging
 import sys
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 
 # Adiciona o caminho do toolkit 3W ao sys.path
@@ -96,6 +98,23 @@ class ThreeWDataset:
             "available": THREEW_AVAILABLE,
         }
 
+    def cache_token(self) -> tuple[str, str, int, int]:
+        """
+        Identifica o conteúdo atual do dataset para chaves de cache em disco.
+
+        Muda quando o dataset é trocado ou atualizado (caminho, versão do
+        toolkit ou mtime dos diretórios de dados e de folds).
+
+        Returns:
+            Tupla (caminho resolvido, versão, mtime do dataset, mtime dos folds)
+        """
+        return (
+            str(self.dataset_path.resolve()),
+            str(self.version),
+            self.dataset_path.stat().st_mtime_ns,
+            self.folds_path.stat().st_mtime_ns,
+        )
+
     def list_available_problems(self) -> list[str]:
         """
         Lista os problemas disponíveis no toolkit 3W.
@@ -107,12 +126,11 @@ class ThreeWDataset:
         if not problems_dir.exists():
             return []
 
-        problems = []
-        for item in problems_dir.iterdir():
-            if item.is_dir() and not item.name.startswith("_"):
-                problems.append(item.name)
-
-        return problems
+        # O mtime do diretório muda quando problemas são adicionados/removidos,
+        # invalidando o cache automaticamente
+        return list(
+            _list_problem_dirs(str(problems_dir), problems_dir.stat().st_mtime_ns)
+        )
 
     def load_problem_config(self, problem_name: str) -> dict | None:
         """
@@ -131,17 +149,17 @@ class ThreeWDataset:
             logging.warning(f"Problema '{problem_name}' não encontrado")
             return None
 
+        # O mtime do README entra na chave do cache, para que edições sejam
+        # percebidas em processos de longa duração
         config_file = problem_dir / "README.md"
-        if config_file.exists():
-            with open(config_file, encoding="utf-8") as f:
-                content = f.read()
-                return {
-                    "name": problem_name,
-                    "description": content,
-                    "path": str(problem_dir),
-                }
+        if not config_file.exists():
+            return None
 
-        return None
+        config = _read_problem_config(
+            str(problem_dir), problem_name, config_file.stat().st_mtime_ns
+        )
+        # Cópia para que o chamador não altere a entrada em cache
+        return dict(config)
 
     def get_event_folds(self, problem_name: str, fold_config: str) -> EventFolds | None:
         """
@@ -197,24 +215,13 @@ class ThreeWDataset:
 
             fold = folds[fold_index]
 
-            # Carrega as instâncias de treino
-            train_instances = load_instances(fold.train_instances)
-            X_train = []
-            y_train = []
-
-            for instance in train_instances:
-                # Assumindo que a primeira coluna é o target
-                X_train.append(instance.iloc[:, 1:].values)  # Features
-                y_train.append(instance.iloc[:, 0].values)  # Target
-
-            # Carrega as instâncias de teste
-            test_instances = load_instances(fold.test_instances)
-            X_test = []
-            y_test = []
-
-            for instance in test_instances:
-                X_test.append(instance.iloc[:, 1:].values)  # Features
-                y_test.append(instance.iloc[:, 0].values)  # Target
+            # Carrega treino e teste em paralelo (a leitura é dominada por I/O
+            # e libera o GIL)
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                train_future = executor.submit(_load_split_arrays, fold.train_instances)
+                test_future = executor.submit(_load_split_arrays, fold.test_instances)
+                X_train, y_train = train_future.result()
+                X_test, y_test = test_future.result()
 
             logging.info(
                 f"Instâncias carregadas - Treino: {len(X_train)}, Teste: {len(X_test)}"
@@ -257,6 +264,51 @@ class ThreeWDataset:
             return None
 
 
+@lru_cache(maxsize=8)
+def _list_problem_dirs(problems_dir: str, mtime_ns: int) -> tuple[str, ...]:
+    """
+    Lista os subdiretórios de problemas, com cache por (diretório, mtime).
+
+    Args:
+        problems_dir: Diretório de problemas do 3W
+        mtime_ns: mtime do diretório, usado apenas como chave do cache
+
+    Returns:
+        Nomes dos problemas
+    """
+    return tuple(
+        item.name
+        for item in Path(problems_dir).iterdir()
+        if item.is_dir() and not item.name.startswith("_")
+    )
+
+
+@lru_cache(maxsize=32)
+def _read_problem_config(problem_dir: str, problem_name: str, mtime_ns: int) -> dict:
+    """
+    Lê o README de um problema, com cache por (diretório, mtime).
+
+    Evita reler o arquivo do disco a cada reexecução das células do notebook.
+
+    Args:
+        problem_dir: Diretório do problema
+        problem_name: Nome do problema
+        mtime_ns: mtime do README, usado apenas como chave do cache
+
+    Returns:
+        Configuração do problema
+    """
+    config_file = Path(problem_dir) / "README.md"
+    with open(config_file, encoding="utf-8") as f:
+        content = f.read()
+
+    return {
+        "name": problem_name,
+        "description": content,
+        "path": problem_dir,
+    }
+
+
 def load_instances(instances_path: str) -> list:
     """
     Carrega instâncias de dados do caminho especificado.
@@ -277,6 +329,25 @@ def load_instances(instances_path: str) -> list:
         return []
 
 
+def _load_split_arrays(instances_path: str) -> tuple[list, list]:
+    """
+    Carrega as instâncias e separa atributos e target de cada uma.
+
+    Args:
+        instances_path: Caminho para as instâncias
+
+    Returns:
+        Tupla (X, y) com uma matriz de atributos e um vetor de target por
+        instância
+    """
+    X, y = [], []
+    for instance in load_instances(instances_path):
+        # Assumindo que a primeira coluna é o target
+        X.append(instance.iloc[:, 1:].values)  # Features
+        y.append(instance.iloc[:, 0].values)  # Target
+    return X, y
+
+
 # Função de conveniência para verificar disponibilidade
 def is_threew_available() -> bool:
     """
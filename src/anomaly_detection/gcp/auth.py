@@ -2,7 +2,9 @@
 Google Cloud Platform authentication management.
 """
 
+import copy
 import os
+import time
 from typing import Any
 
 from google.auth import default
@@ -11,6 +13,17 @@ from google.auth.transport.requests import Request
 from google.cloud import aiplatform, logging, monitoring, storage
 from google.oauth2 import service_account
 
+# Successful authentication test results are reused for this long
+AUTH_TEST_TTL_SECONDS = 600
+
+# (key path, key mtime, project id) -> (monotonic timestamp, test results)
+_auth_test_cache: dict[tuple, tuple[float, dict[str, Any]]] = {}
+
+
+def clear_authentication_cache() -> None:
+    """Forget cached authentication test results."""
+    _auth_test_cache.clear()
+
 
 class GCPAuthenticator:
     """
@@ -146,13 +159,44 @@ class GCPAuthenticator:
         """Get Cloud Monitoring client."""
         return self.get_client("monitoring")
 
-    def test_authentication(self) -> dict[str, Any]:
+    def _auth_test_cache_key(self) -> tuple:
+        """Cache key that changes whenever the credentials may have changed."""
+        key_path = self.config.auth.service_account_key_path
+        key_mtime = (
+            os.path.getmtime(key_path)
+            if key_path and os.path.exists(key_path)
+            else None
+        )
+        return (key_path, key_mtime, self.project_id)
+
+    def test_authentication(self, use_cache: bool = True) -> dict[str, Any]:
         """
         Test authentication with all services.
 
+        Successful results are cached per process for AUTH_TEST_TTL_SECONDS,
+        keyed on the service account key file and project, so submitting
+        several jobs in a row doesn't repeat the service API calls.
+
+        Args:
+            use_cache: Reuse a recent successful result if available
+
         Returns:
             Dictionary with authentication test results
         """
+        cache_key = self._auth_test_cache_key()
+        cached = _auth_test_cache.get(cache_key) if use_cache else None
+        if cached and time.monotonic() - cached[0] < AUTH_TEST_TTL_SECONDS:
+            return copy.deepcopy(cached[1])
+
+        results = self._run_authentication_test()
+
+        if results["authenticated"] and not results["errors"]:
+            _auth_test_cache[cache_key] = (time.monotonic(), copy.deepcopy(results))
+
+        return results
+
+    def _run_authentication_test(self) -> dict[str, Any]:
+        """Call each service once to check the credentials."""
         results = {
             "authenticated": False,
             "project_id": self.project_id,
@@ -4,12 +4,15 @@ MLflow integration with Google Cloud Storage for experiment tracking.
 
 import logging
 import os
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
 from typing import Any
 
 import mlflow
 import mlflow.pytorch
 import mlflow.sklearn
-from mlflow.entities import Experiment, Run
+from mlflow.entities import Experiment, Metric, Param, Run
 from mlflow.tracking import MlflowClient
 
 logger = logging.getLogger(__name__)
@@ -41,6 +44,10 @@ class MLflowGCSIntegration:
         # Initialize MLflow client
         self.client = MlflowClient()
 
+        # Params/metrics buffered by batch_logging(); None when not batching
+        self._pending_params: dict[str, Any] | None = None
+        self._pending_metrics: list[Metric] | None = None
+
         # Get or create experiment
         self.experiment = self._get_or_create_experiment()
 
@@ -139,8 +146,10 @@ class MLflowGCSIntegration:
             params: Dictionary of parameter names and values
         """
         try:
-            for param_name, param_value in params.items():
-                mlflow.log_param(param_name, param_value)
+            if self._pending_params is not None:
+                self._pending_params.update(params)
+            else:
+                mlflow.log_params(params)
 
             logger.info(f"Logged {len(params)} parameters")
 
@@ -157,8 +166,14 @@ class MLflowGCSIntegration:
             step: Optional step number
         """
         try:
-            for metric_name, metric_value in metrics.items():
-                mlflow.log_metric(metric_name, metric_value, step=step)
+            if self._pending_metrics is not None:
+                timestamp = int(time.time() * 1000)
+                self._pending_metrics.extend(
+                    Metric(name, float(value), timestamp, step or 0)
+                    for name, value in metrics.items()
+                )
+            else:
+                mlflow.log_metrics(metrics, step=step)
 
             logger.info(f"Logged {len(metrics)} metrics")
 
@@ -166,6 +181,47 @@ class MLflowGCSIntegration:
             logger.error(f"Failed to log metrics: {e}")
             raise
 
+    @contextmanager
+    def batch_logging(self) -> Iterator[None]:
+        """
+        Buffer params and metrics and send them in a single request.
+
+        Inside the block, log_params and log_metrics only record values
+        locally; on exit everything is sent to the active run with one
+        ``log_batch`` call instead of one round trip per logging call.
+
+        If the block raises, a failed flush is only logged so the original
+        exception propagates.
+        """
+        self._pending_params = {}
+        self._pending_metrics = []
+        body_failed = False
+        try:
+            yield
+        except BaseException:
+            body_failed = True
+            raise
+        finally:
+            params, metrics = self._pending_params, self._pending_metrics
+            self._pending_params = None
+            self._pending_metrics = None
+
+            if params or metrics:
+                try:
+                    self.client.log_batch(
+                        mlflow.active_run().info.run_id,
+                        metrics=metrics,
+                        params=[Param(k, str(v)) for k, v in params.items()],
+                    )
+                    logger.info(
+                        f"Logged batch of {len(params)} parameters "
+                        f"and {len(metrics)} metrics"
+                    )
+                except Exception as e:
+                    logger.error(f"Failed to log batch: {e}")
+                    if not body_failed:
+                        raise
+
     def log_artifact(self, local_path: str, artifact_path: str | None = None) -> None:
         """
         Log an artifact to the current run.
@@ -182,6 +238,22 @@ class MLflowGCSIntegration:
             logger.error(f"Failed to log artifact {local_path}: {e}")
             raise
 
+    def log_text(self, text: str, artifact_file: str) -> None:
+        """
+        Log a text snippet to the current run as a single artifact file.
+
+        Args:
+            text: Text content
+            artifact_file: Run-relative path of the file, e.g. "info.txt"
+        """
+        try:
+            mlflow.log_text(text, artifact_file)
+            logger.info(f"Logged text artifact: {artifact_file}")
+
+        except Exception as e:
+            logger.error(f"Failed to log text artifact {artifact_file}: {e}")
+            raise
+
     def log_model(self, model, artifact_path: str, **kwargs) -> None:
         """
         Log a model to the current run.
@@ -338,6 +338,23 @@ class AIPlatformTrainer:
             logger.error(f"Failed to cancel training job {job_id}: {e}")
             return False
 
+    def _job_logs_command(self, job_id: str, max_lines: int | None = None) -> list[str]:
+        """Build the gcloud command that streams a training job's logs."""
+        cmd = [
+            "gcloud",
+            "ai",
+            "custom-jobs",
+            "stream-logs",
+            job_id,
+            f"--region={self.region}",
+            f"--project={self.project_id}",
+        ]
+
+        if max_lines:
+            cmd.extend(["--max-lines", str(max_lines)])
+
+        return cmd
+
     def get_job_logs(self, job_id: str, max_lines: int | None = None) -> str:
         """
         Get logs from a training job.
@@ -351,18 +368,7 @@ class AIPlatformTrainer:
         """
         try:
             # Use gcloud to get logs
-            cmd = [
-                "gcloud",
-                "ai",
-                "custom-jobs",
-                "stream-logs",
-                job_id,
-                f"--region={self.region}",
-                f"--project={self.project_id}",
-            ]
-
-            if max_lines:
-                cmd.extend(["--max-lines", str(max_lines)])
+            cmd = self._job_logs_command(job_id, max_lines)
 
             result = subprocess.run(cmd, capture_output=True, text=True, check=True)
 
@@ -377,31 +383,73 @@ class AIPlatformTrainer:
             logger.error(f"Failed to get logs for training job {job_id}: {e}")
             raise
 
-    def wait_for_job_completion(self, job_id: str, timeout_minutes: int = 120) -> str:
+    def save_job_logs(
+        self, job_id: str, output_path: str, max_lines: int | None = None
+    ) -> str:
+        """
+        Stream logs from a training job straight to a local file.
+
+        Unlike get_job_logs, the output of gcloud is written to disk as it
+        arrives, so long jobs don't need their full log held in memory.
+
+        Args:
+            job_id: Training job ID
+            output_path: Local file to write the logs to
+            max_lines: Maximum number of log lines to write
+
+        Returns:
+            Path to the written log file
+        """
+        try:
+            cmd = self._job_logs_command(job_id, max_lines)
+
+            with open(output_path, "w") as log_file:
+                subprocess.run(
+                    cmd, stdout=log_file, stderr=subprocess.PIPE, text=True, check=True
+                )
+
+            logger.info(f"Saved logs for training job {job_id} to {output_path}")
+            return output_path
+
+        except subprocess.CalledProcessError as e:
+            logger.error(f"Failed to save logs for training job {job_id}: {e}")
+            logger.error(f"stderr: {e.stderr}")
+            raise
+        except Exception as e:
+            logger.error(f"Failed to save logs for training job {job_id}: {e}")
+            raise
+
+    def wait_for_job_completion(
+        self,
+        job_id: str,
+        timeout_minutes: int = 120,
+        poll_interval: float = 15.0,
+        max_poll_interval: float = 300.0,
+    ) -> str:
         """
         Wait for a training job to complete.
 
+        The job state is checked with capped exponential backoff: the wait
+        between checks starts at ``poll_interval`` and doubles up to
+        ``max_poll_interval``, never sleeping past the timeout.
+
         Args:
             job_id: Training job ID
             timeout_minutes: Timeout in minutes
+            poll_interval: Initial wait between status checks, in seconds
+            max_poll_interval: Maximum wait between status checks, in seconds
 
         Returns:
             Final job state
         """
         import time
 
-        start_time = time.time()
-        timeout_seconds = timeout_minutes * 60
+        deadline = time.monotonic() + timeout_minutes * 60
+        delay = poll_interval
 
         logger.info(f"Waiting for training job {job_id} to complete...")
 
         while True:
-            # Check if timeout exceeded
-            if time.time() - start_time > timeout_seconds:
-                raise TimeoutError(
-                    f"Training job {job_id} did not complete within {timeout_minutes} minutes"
-                )
-
             try:
                 # Get job status
                 job_info = self.get_training_job(job_id)
@@ -414,12 +462,19 @@ class AIPlatformTrainer:
                     logger.info(f"Training job {job_id} completed with state: {state}")
                     return state
 
-                # Wait before checking again
-                time.sleep(30)
-
             except Exception as e:
                 logger.warning(f"Error checking job status: {e}")
-                time.sleep(30)
+
+            # Check if timeout exceeded
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise TimeoutError(
+                    f"Training job {job_id} did not complete within {timeout_minutes} minutes"
+                )
+
+            # Wait before checking again
+            time.sleep(min(delay, remaining))
+            delay = min(delay * 2, max_poll_interval)
 
     def create_training_script(
         self, script_name: str, model_type: str, **kwargs
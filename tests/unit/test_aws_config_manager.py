@@ -5,7 +5,10 @@ import sys
 
 sys.path.insert(0, ".")
 
-from src.anomaly_detection.aws.aws_config_manager import AWSConfigManager
+from src.anomaly_detection.aws.aws_config_manager import (
+    AWSConfigManager,
+    get_aws_client,
+)
 
 
 class TestAWSConfigManager(unittest.TestCase):
@@ -13,6 +16,9 @@ class TestAWSConfigManager(unittest.TestCase):
 
     def setUp(self):
         """Set up a mock environment for each test."""
+        # Clients are cached per process; start each test from a clean cache
+        get_aws_client.cache_clear()
+
         # Mock config and env files
         self.mock_config_content = {
             "aws": {"region": "us-west-2"},
@@ -45,46 +51,47 @@ class TestAWSConfigManager(unittest.TestCase):
     @patch("boto3.client")
     def test_validate_aws_credentials_success(self, mock_boto_client):
         """Test successful AWS credential validation."""
-        # Mock the S3 client and its list_buckets method
-        mock_s3 = MagicMock()
-        mock_boto_client.return_value = mock_s3
+        # Mock the STS client and its get_caller_identity method
+        mock_sts = MagicMock()
+        mock_sts.get_caller_identity.return_value = {"Account": "123456789012"}
+        mock_boto_client.return_value = mock_sts
 
         manager = AWSConfigManager(
             config_path="nonexistent.yaml", env_path="nonexistent.env"
         )
-        manager.s3_client = mock_s3  # Assign the mocked client
+        manager.sts_client = mock_sts  # Assign the mocked client
 
         result = manager.validate_aws_credentials()
 
         self.assertTrue(result)
-        mock_s3.list_buckets.assert_called_once()
+        mock_sts.get_caller_identity.assert_called_once()
 
     @patch("boto3.client")
     def test_validate_aws_credentials_failure(self, mock_boto_client):
         """Test failed AWS credential validation."""
         from botocore.exceptions import ClientError
 
-        mock_s3 = MagicMock()
-        mock_s3.list_buckets.side_effect = ClientError(
+        mock_sts = MagicMock()
+        mock_sts.get_caller_identity.side_effect = ClientError(
             {
                 "Error": {
-                    "Code": "InvalidAccessKeyId",
-                    "Message": "Invalid Access Key ID",
+                    "Code": "InvalidClientTokenId",
+                    "Message": "The security token included in the request is invalid.",
                 }
             },
-            "ListBuckets",
+            "GetCallerIdentity",
         )
-        mock_boto_client.return_value = mock_s3
+        mock_boto_client.return_value = mock_sts
 
         manager = AWSConfigManager(
             config_path="nonexistent.yaml", env_path="nonexistent.env"
         )
-        manager.s3_client = mock_s3
+        manager.sts_client = mock_sts
 
         result = manager.validate_aws_credentials()
 
         self.assertFalse(result)
-        mock_s3.list_buckets.assert_called_once()
+        mock_sts.get_caller_identity.assert_called_once()
 
     @patch("boto3.client")
     def test_create_s3_bucket_already_exists(self, mock_boto_client):
@@ -135,6 +142,39 @@ class TestAWSConfigManager(unittest.TestCase):
         mock_s3.put_bucket_versioning.assert_called_once()
         mock_s3.put_bucket_encryption.assert_called_once()
 
+    @patch("boto3.client")
+    def test_upload_file_uses_transfer_config(self, mock_boto_client):
+        """Test that uploads go through the configured transfer manager."""
+        from boto3.s3.transfer import TransferConfig
+
+        mock_s3 = MagicMock()
+        mock_boto_client.return_value = mock_s3
+
+        manager = AWSConfigManager(
+            config_path="nonexistent.yaml", env_path="nonexistent.env"
+        )
+        manager.s3_client = mock_s3
+        manager.config = self.mock_config_content
+
+        result = manager.upload_file("data/train.parquet", "data/train.parquet")
+
+        self.assertTrue(result)
+        args, kwargs = mock_s3.upload_file.call_args
+        self.assertEqual(
+            args, ("data/train.parquet", "test-bucket", "data/train.parquet")
+        )
+        self.assertIsInstance(kwargs["Config"], TransferConfig)
+
+    @patch("boto3.client")
+    def test_get_aws_client_is_shared(self, mock_boto_client):
+        """Test that each service client is created only once per process."""
+        first = get_aws_client("s3")
+        second = get_aws_client("s3")
+
+        self.assertIs(first, second)
+        mock_boto_client.assert_called_once()
+        self.assertEqual(mock_boto_client.call_args.args, ("s3",))
+
 
 if __name__ == "__main__":
     unittest.main()